@@ -0,0 +1,19 @@
+from __future__ import annotations
+import sys
+from typing import List, Optional
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    args = sys.argv[1:] if argv is None else list(argv)
+    if not args or args[0].lower() == "gui":
+        from autofs_gui.presentation.gui.app import run as gui_run
+
+        gui_run(args[1:])
+        return
+    from autofs_gui.presentation.cli.main import main
+
+    raise SystemExit(main(args))
+
+
+if __name__ == "__main__":
+    run()
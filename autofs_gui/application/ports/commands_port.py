@@ -1,7 +1,7 @@
 from __future__ import annotations
-from typing import Protocol, Tuple
+from typing import Protocol, Sequence, Tuple, Union
 
 
 class CommandsPort(Protocol):
-    def run(self, cmd: str, timeout: int = 15) -> Tuple[int, str, str]:
+    def run(self, cmd: Union[str, Sequence[str]], timeout: int = 15) -> Tuple[int, str, str]:
         ...
@@ -1,10 +1,19 @@
 from __future__ import annotations
-from typing import Protocol, Optional
+from typing import Iterable, Protocol, Optional, Tuple, Union
 
 
 class FilesPort(Protocol):
     def read(self, path: str) -> Optional[str]:
         ...
 
-    def write_atomic(self, path: str, content: str) -> None:
+    def read_bytes(self, path: str) -> Optional[bytes]:
+        ...
+
+    def mtime(self, path: str) -> Optional[int]:
+        ...
+
+    def write_atomic(self, path: str, content: Union[str, bytes]) -> None:
+        ...
+
+    def write_many_atomic(self, pairs: Iterable[Tuple[str, Union[str, bytes]]]) -> None:
         ...
@@ -1,13 +1,30 @@
 from __future__ import annotations
+import shlex
 from typing import Tuple, List, Dict, Any, Optional, Callable
 
 from autofs_gui.application.ports import CommandsPort, FilesPort
 from autofs_gui.domain.services import build_master_file as build_master_text, build_map_file
-from autofs_gui.infrastructure.parsers import parse_map_text
+from autofs_gui.infrastructure.parsers import MountCheck, parse_map_text, parse_verify_output
 from autofs_gui.infrastructure.ssh import build_ssh_test_cmd
-from autofs_gui.infrastructure.system import run_sudo
+from autofs_gui.infrastructure.system import HAS_SYSTEMCTL, LS, MOUNTPOINT, SYSTEMCTL, UMOUNT, run_sudo
 from .paths import Paths
 
+# Prebuilt systemctl argv per supported action
+_SERVICE_ARGV: Dict[str, List[str]] = {
+    "status": [SYSTEMCTL, "status", "autofs", "--no-pager"],
+    **{action: [SYSTEMCTL, action, "autofs"] for action in ("start", "stop", "restart", "enable", "disable")},
+}
+# Actions that change the service and therefore go through sudo
+_PRIVILEGED_ACTIONS = frozenset({"start", "stop", "restart", "enable", "disable"})
+NO_SYSTEMCTL_MESSAGE = "systemctl no está disponible en este sistema; gestiona el servicio autofs por otros medios."
+
+
+def _service_argv(action: str) -> List[str]:
+    try:
+        return _SERVICE_ARGV[action]
+    except KeyError:
+        raise ValueError(f"Acción de servicio no soportada: {action}") from None
+
 
 # Simple shell-quote helper without importing shlex in UI
 def shlex_quote(s: str) -> str:
@@ -21,6 +38,8 @@ class UseCases:
         self.files = files
         self.paths = paths
         self.ask_pass = ask_pass
+        # (path, mtime_ns) of a fuse.conf already known to enable user_allow_other
+        self._fuse_conf_ok: Optional[Tuple[str, Optional[int]]] = None
 
     def build_files(self, entries: List[Dict[str, Any]], timeout: int, ghost: bool) -> Tuple[str, str]:
         master_body = build_master_text(self.paths.MAP_FILE_PATH, timeout, ghost)
@@ -52,49 +71,77 @@ class UseCases:
         return entries, timeout, ghost
 
     def service_cmd(self, action: str) -> str:
-        if action == "status":
-            return "systemctl status autofs --no-pager"
-        return f"systemctl {action} autofs"
+        return shlex.join(_service_argv(action))
 
     def enable_user_allow_other(self, fuse_conf_path: str) -> None:
-        txt = self.files.read(fuse_conf_path) or ""
-        if txt and "user_allow_other" in txt:
-            new = txt.replace("#user_allow_other", "user_allow_other")
+        mtime = self.files.mtime(fuse_conf_path)
+        if mtime is not None and self._fuse_conf_ok == (fuse_conf_path, mtime):
+            return
+        data = self.files.read_bytes(fuse_conf_path) or b""
+        if data and b"user_allow_other" in data:
+            new = data.replace(b"#user_allow_other", b"user_allow_other")
         else:
-            new = (txt + "\n" if txt else "") + "user_allow_other\n"
+            new = (data + b"\n" if data else b"") + b"user_allow_other\n"
+        if new == data:
+            self._fuse_conf_ok = (fuse_conf_path, mtime)
+            return
         # Direct write first; if fails, elevate via sudo copy
         try:
             self.files.write_atomic(fuse_conf_path, new)
-            return
         except Exception:
             tmp = "/tmp/fuse.conf.user_allow_other"
             self.files.write_atomic(tmp, new)
             rc, out, err = run_sudo(f"cp {shlex_quote(tmp)} {shlex_quote(fuse_conf_path)}", timeout=20, ask_pass=self.ask_pass)
             if rc != 0:
                 raise PermissionError(err or "sudo copy failed")
+        self._fuse_conf_ok = (fuse_conf_path, self.files.mtime(fuse_conf_path))
 
     def ssh_test_cmd(self, entry: Dict[str, Any], check_path: bool = True, timeout_sec: int = 10) -> str:
         return build_ssh_test_cmd(entry, check_path=check_path, timeout_sec=timeout_sec)
 
     # Convenience wrappers that execute via runner
     def service(self, action: str, timeout: int = 30) -> Tuple[int, str, str]:
-        cmd = self.service_cmd(action)
-        if action == "status":
-            return self.runner.run(cmd, timeout)
-        return run_sudo(cmd, timeout=timeout, ask_pass=self.ask_pass)
+        argv = _service_argv(action)
+        if not HAS_SYSTEMCTL:
+            return 127, "", NO_SYSTEMCTL_MESSAGE
+        if action not in _PRIVILEGED_ACTIONS:
+            return self.runner.run(argv, timeout)
+        return run_sudo(shlex.join(argv), timeout=timeout, ask_pass=self.ask_pass)
+
+    def ls_argv(self, path: str) -> List[str]:
+        return [LS, "-la", "--", path]
+
+    def umount_argv(self, path: str) -> List[str]:
+        return [UMOUNT, "-f", "--", path]
 
     def test_ls(self, path: str, timeout: int = 30) -> Tuple[int, str, str]:
-        return self.runner.run(f"ls -la {shlex_quote(path)}", timeout)
+        return self.runner.run(self.ls_argv(path), timeout)
 
     def umount(self, path: str, timeout: int = 30) -> Tuple[int, str, str]:
-        return self.runner.run(f"umount -f {shlex_quote(path)}", timeout)
+        return self.runner.run(self.umount_argv(path), timeout)
 
     def ssh_test(self, entry: Dict[str, Any], check_path: bool = True, timeout_sec: int = 10) -> Tuple[int, str, str]:
         cmd = self.ssh_test_cmd(entry, check_path=check_path, timeout_sec=timeout_sec)
         return self.runner.run(cmd, max(timeout_sec + 10, 20))
 
     def check_mount(self, path: str, timeout: int = 10) -> Tuple[int, str, str]:
-        return self.runner.run(f"mountpoint {shlex_quote(path)}", timeout)
+        return self.runner.run([MOUNTPOINT, "--", path], timeout)
+
+    def batch_verify(self, paths: List[str], timeout: int = 40) -> Dict[str, MountCheck]:
+        # One shell for every path: `ls -la` + `mountpoint`, delimited by ##P/##L/##M/##E markers
+        if not paths:
+            return {}
+        script = (
+            f"for p in {shlex.join(paths)}; do "
+            f"printf '##P %s\\n' \"$p\"; {shlex.quote(LS)} -la -- \"$p\" 2>&1; printf '##L %d\\n' $?; "
+            f"printf '##M %s\\n' \"$p\"; {shlex.quote(MOUNTPOINT)} -- \"$p\" 2>&1; printf '##E %d\\n' $?; "
+            "done"
+        )
+        rc, out, err = self.runner.run(["sh", "-c", script], timeout * len(paths))
+        checks = parse_verify_output(out)
+        if not checks and rc != 0:
+            raise RuntimeError(err or out or f"La verificación por lotes falló (código {rc}).")
+        return {c.path: c for c in checks}
 
     def ensure_root_access(self, entry: Dict[str, Any]) -> Optional[str]:
         host = (entry.get("host") or "").strip()
@@ -139,14 +186,37 @@ class UseCases:
     def trigger_mount(self, path: str, timeout: int = 20) -> Tuple[int, str, str]:
         return run_sudo(f"ls -la {shlex_quote(path)}", timeout=timeout, ask_pass=self.ask_pass)
 
+    def trigger_mount_batch(self, paths: List[str], timeout: int = 20) -> Tuple[int, Dict[str, int], str]:
+        # One sudo invocation that accesses every path; prints "<path> <rc>" per line
+        if not paths:
+            return 0, {}, ""
+        script = (
+            f"for p in {shlex.join(paths)}; do "
+            f"{shlex.quote(LS)} -la -- \"$p\" >/dev/null 2>&1; printf '%s %d\\n' \"$p\" $?; "
+            "done"
+        )
+        rc, out, err = run_sudo(script, timeout=timeout * len(paths), ask_pass=self.ask_pass)
+        wanted = set(paths)
+        results: Dict[str, int] = {}
+        for line in (out or "").splitlines():
+            path, _, code = line.rpartition(" ")
+            if path in wanted:
+                try:
+                    results[path] = int(code)
+                except ValueError:
+                    results[path] = 1
+        return rc, results, err
+
     def collect_autofs_log(self, lines: int = 40) -> Tuple[int, str, str]:
         cmd = f"journalctl -u autofs -n {lines} --no-pager"
         return run_sudo(cmd, timeout=20, ask_pass=self.ask_pass)
 
     def write_config(self, master_body: str, map_body: str, as_root: bool) -> Dict[str, Any]:
         if as_root:
-            self.files.write_atomic(self.paths.MASTER_D_PATH, master_body)
-            self.files.write_atomic(self.paths.MAP_FILE_PATH, map_body)
+            self.files.write_many_atomic([
+                (self.paths.MASTER_D_PATH, master_body),
+                (self.paths.MAP_FILE_PATH, map_body),
+            ])
             return {
                 "temporary": False,
                 "paths": (self.paths.MASTER_D_PATH, self.paths.MAP_FILE_PATH),
@@ -155,8 +225,7 @@ class UseCases:
         # Try sudo copy from /tmp
         tmp_master = "/tmp/sshfs-manager.autofs"
         tmp_map = "/tmp/auto.sshfs-manager"
-        self.files.write_atomic(tmp_master, master_body)
-        self.files.write_atomic(tmp_map, map_body)
+        self.files.write_many_atomic([(tmp_master, master_body), (tmp_map, map_body)])
         rc, out, err = run_sudo(
             f"cp {shlex_quote(tmp_master)} {shlex_quote(self.paths.MASTER_D_PATH)} && cp {shlex_quote(tmp_map)} {shlex_quote(self.paths.MAP_FILE_PATH)}",
             timeout=30,
@@ -3,7 +3,7 @@ from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SshfsEntry:
     mount_point: str
     host: str
@@ -27,3 +27,7 @@ class SshfsEntry:
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Mapping-style read so the map builder and validator take an entry or its dict
+        return getattr(self, key, default)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Dict, Any
 
 
@@ -9,6 +9,9 @@ class UIState:
     active_tab: int = 0
     filter_query: str = ""
     ui_theme: str = "clam"
+    log_min_level: int = 0
+    # Last directory used by each file chooser ("mount", "identity")
+    last_dirs: Dict[str, str] = field(default_factory=dict)
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "UIState":
@@ -1,21 +1,25 @@
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
+from autofs_gui.domain.models import SshfsEntry
 
-def validate_entry(entry: Dict[str, Any]) -> None:
-    mp = (entry.get("mount_point") or "").strip()
-    host = (entry.get("host") or "").strip()
-    rpath = (entry.get("remote_path") or "").strip()
-    if not mp:
-        raise ValueError("El punto de montaje es obligatorio.")
-    if not host:
-        raise ValueError("El host es obligatorio.")
-    if not rpath:
-        raise ValueError("La ruta remota es obligatoria.")
+# (field, message) checked in order; the first empty one is reported
+_REQUIRED_FIELDS = (
+    ("mount_point", "El punto de montaje es obligatorio."),
+    ("host", "El host es obligatorio."),
+    ("remote_path", "La ruta remota es obligatoria."),
+)
+
+
+def validate_entry(entry: Union[Dict[str, Any], SshfsEntry]) -> None:
+    values = [(entry.get(field) or "").strip() for field, _ in _REQUIRED_FIELDS]
+    missing = next((msg for value, (_, msg) in zip(values, _REQUIRED_FIELDS) if not value), None)
+    if missing:
+        raise ValueError(missing)
+    mp, host, rpath = values
     if not mp.startswith('/'):
         raise ValueError("El punto de montaje debe ser una ruta absoluta (empieza por '/').")
     if any(c.isspace() for c in host):
         raise ValueError("El host no debe contener espacios.")
     if not rpath.startswith('/'):
         raise ValueError("La ruta remota debería empezar por '/'.")
-
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
@@ -25,14 +26,21 @@ _CACHE_TS: float = 0.0
 _CACHE_TTL = 60  # seconds
 
 
+@functools.lru_cache(maxsize=32)
+def _which(name: str, search_path: Optional[str]) -> Optional[str]:
+    # Keyed by PATH so a changed environment is looked up again
+    return shutil.which(name, path=search_path)
+
+
 def _run_command(cmd: List[str], timeout: int = 5) -> Tuple[int, str, str]:
     if not cmd:
         return 1, "", "empty command"
-    if not shutil.which(cmd[0]):
+    exe = _which(cmd[0], os.environ.get("PATH"))
+    if not exe:
         return 127, "", f"{cmd[0]} not found"
     try:
         proc = subprocess.run(
-            cmd,
+            [exe, *cmd[1:]],
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -1 +1,2 @@
 from .map_parser import parse_map_text
+from .verify_parser import MountCheck, parse_verify_output
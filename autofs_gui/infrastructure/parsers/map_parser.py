@@ -1,6 +1,23 @@
 from __future__ import annotations
+import re
 from typing import List, Dict
 
+_MAP_LINE_RE = re.compile(
+    r"^(?P<mp>\S+)\s+-fstype=(?P<fstype>[^,\s]*)(?P<opts>(?:,[^,\s]*)*)"
+    r"\s+:?(?:(?P<user>[^@\s:]+)@)?(?P<host>[^:\s]+):(?P<rpath>\S*)$"
+)
+# key=value options mapped to their entry field; anything else goes to extra_options
+_KV_OPTS = {
+    "IdentityFile": "identity_file",
+    "uid": "uid",
+    "gid": "gid",
+    "umask": "umask",
+    "ServerAliveInterval": "server_alive_interval",
+    "ServerAliveCountMax": "server_alive_count",
+}
+# Bare flag options stored as booleans on the entry
+_BOOL_OPTS = frozenset({"allow_other", "reconnect", "delay_connect"})
+
 
 def parse_map_text(map_txt: str) -> List[Dict]:
     new_entries: List[Dict] = []
@@ -10,72 +27,37 @@ def parse_map_text(map_txt: str) -> List[Dict]:
         line = line.strip()
         if not line or line.startswith("#"):
             continue
-        try:
-            left, rest = line.split(" ", 1)
-            opts_part, remote_part = rest.rsplit(" ", 1)
-            if not opts_part.startswith("-fstype="):
-                continue
-            opt_items = opts_part.split(",")
-            fstype = opt_items[0].split("=", 1)[1]
-            opts = opt_items[1:]
-            identity_file = ""
-            allow_other = False
-            uid = gid = umask = ""
-            sai = sac = ""
-            reconnect = delay_connect = False
-            extra_opts: List[str] = []
-
-            for o in opts:
-                if "=" in o:
-                    k, v = o.split("=", 1)
-                    if k == "IdentityFile":
-                        identity_file = v
-                    elif k == "uid":
-                        uid = v
-                    elif k == "gid":
-                        gid = v
-                    elif k == "umask":
-                        umask = v
-                    elif k == "ServerAliveInterval":
-                        sai = v
-                    elif k == "ServerAliveCountMax":
-                        sac = v
-                    else:
-                        extra_opts.append(o)
-                else:
-                    if o == "allow_other":
-                        allow_other = True
-                    elif o == "reconnect":
-                        reconnect = True
-                    elif o == "delay_connect":
-                        delay_connect = True
-                    else:
-                        extra_opts.append(o)
-
-            rp = remote_part[1:] if remote_part.startswith(":") else remote_part
-            if "@" in rp.split(":", 1)[0]:
-                user, resth = rp.split("@", 1)
+        m = _MAP_LINE_RE.match(line)
+        if not m:
+            continue
+        values = {field: "" for field in _KV_OPTS.values()}
+        flags = dict.fromkeys(_BOOL_OPTS, False)
+        extra_opts: List[str] = []
+        opts = m["opts"]
+        for o in opts[1:].split(",") if opts else ():
+            k, sep, v = o.partition("=")
+            field = _KV_OPTS.get(k) if sep else None
+            if field:
+                values[field] = v
+            elif not sep and o in _BOOL_OPTS:
+                flags[o] = True
             else:
-                user, resth = "", rp
-            host, rpath = resth.split(":", 1)
-            rpath_gui = rpath.replace(r"\040", " ")
-
-            new_entries.append({
-                "mount_point": left,
-                "user": user,
-                "host": host,
-                "remote_path": rpath_gui,
-                "fstype": fstype,
-                "identity_file": identity_file,
-                "allow_other": allow_other,
-                "uid": uid, "gid": gid, "umask": umask,
-                "server_alive_interval": int(sai) if sai else 15,
-                "server_alive_count": int(sac) if sac else 3,
-                "reconnect": reconnect,
-                "delay_connect": delay_connect,
-                "extra_options": ",".join(extra_opts)
-            })
-        except Exception:
+                extra_opts.append(o)
+        sai, sac = values["server_alive_interval"], values["server_alive_count"]
+        try:
+            values["server_alive_interval"] = int(sai) if sai else 15
+            values["server_alive_count"] = int(sac) if sac else 3
+        except ValueError:
             continue
-    return new_entries
 
+        new_entries.append({
+            "mount_point": m["mp"],
+            "user": m["user"] or "",
+            "host": m["host"],
+            "remote_path": m["rpath"].replace(r"\040", " "),
+            "fstype": m["fstype"],
+            **values,
+            **flags,
+            "extra_options": ",".join(extra_opts),
+        })
+    return new_entries
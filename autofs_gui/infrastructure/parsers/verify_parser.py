@@ -0,0 +1,58 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Markers printed by the batch verification script (see UseCases.batch_verify):
+#   ##P <path>   start of `ls -la` output for <path>
+#   ##L <rc>     exit code of `ls -la`
+#   ##M <path>   start of `mountpoint` output for <path>
+#   ##E <rc>     exit code of `mountpoint`
+LS_MARK = "##P "
+LS_RC_MARK = "##L "
+MOUNT_MARK = "##M "
+MOUNT_RC_MARK = "##E "
+
+
+@dataclass
+class MountCheck:
+    path: str
+    ls_rc: int = 1
+    ls_out: str = ""
+    mount_rc: int = 1
+    mount_out: str = ""
+
+
+def _parse_rc(value: str) -> int:
+    try:
+        return int(value.strip())
+    except ValueError:
+        return 1
+
+
+def parse_verify_output(text: str) -> List[MountCheck]:
+    checks: List[MountCheck] = []
+    if not text:
+        return checks
+    current: Optional[MountCheck] = None
+    section: Optional[str] = None
+    buf: List[str] = []
+    for line in text.splitlines():
+        if line.startswith(LS_MARK):
+            current = MountCheck(path=line[len(LS_MARK):])
+            checks.append(current)
+            section, buf = "ls", []
+        elif current is None:
+            continue
+        elif line.startswith(LS_RC_MARK) and section == "ls":
+            current.ls_rc = _parse_rc(line[len(LS_RC_MARK):])
+            current.ls_out = "\n".join(buf).strip()
+            section, buf = None, []
+        elif line.startswith(MOUNT_MARK):
+            section, buf = "mount", []
+        elif line.startswith(MOUNT_RC_MARK) and section == "mount":
+            current.mount_rc = _parse_rc(line[len(MOUNT_RC_MARK):])
+            current.mount_out = "\n".join(buf).strip()
+            section, buf = None, []
+        elif section:
+            buf.append(line)
+    return checks
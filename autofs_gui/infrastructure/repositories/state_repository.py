@@ -1,20 +1,35 @@
 from __future__ import annotations
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Set
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
 APP_CONFIG_DIR = os.path.expanduser("~/.config/autofs_manager")
 APP_CONFIG_FILE = os.path.join(APP_CONFIG_DIR, "state.json")
 
 
+# Directories already created by this process; every load/save asks for the config dir
+_ENSURED_DIRS: Set[str] = set()
+
+
 def ensure_config_dir() -> None:
+    if APP_CONFIG_DIR in _ENSURED_DIRS:
+        return
     os.makedirs(APP_CONFIG_DIR, exist_ok=True)
+    _ENSURED_DIRS.add(APP_CONFIG_DIR)
 
 
 def load_state() -> Dict[str, Any]:
     ensure_config_dir()
     if os.path.exists(APP_CONFIG_FILE):
         try:
+            if orjson is not None:
+                with open(APP_CONFIG_FILE, "rb") as f:
+                    return orjson.loads(f.read())
             with open(APP_CONFIG_FILE, "r", encoding="utf-8") as f:
                 return json.load(f)
         except Exception:
@@ -24,6 +39,19 @@ def load_state() -> Dict[str, Any]:
 
 def save_state(data: Dict[str, Any]) -> None:
     ensure_config_dir()
+    try:
+        _write_state(data)
+    except FileNotFoundError:
+        # The directory was removed while the app was running
+        _ENSURED_DIRS.discard(APP_CONFIG_DIR)
+        ensure_config_dir()
+        _write_state(data)
+
+
+def _write_state(data: Dict[str, Any]) -> None:
+    if orjson is not None:
+        with open(APP_CONFIG_FILE, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(APP_CONFIG_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
-
@@ -1,3 +1,4 @@
+from .binaries import HAS_SYSTEMCTL, LS, MOUNTPOINT, SYSTEMCTL, UMOUNT
 from .command_runner import CommandRunner
 from .constants import FUSE_CONF, MAP_FILE_PATH, MASTER_D_PATH
 from .file_system_gateway import FileSystemGateway
@@ -6,6 +7,11 @@ from .sudo_runner import run_sudo, have_sudo_noninteractive
 
 __all__ = [
     "CommandRunner",
+    "HAS_SYSTEMCTL",
+    "LS",
+    "MOUNTPOINT",
+    "SYSTEMCTL",
+    "UMOUNT",
     "FUSE_CONF",
     "MAP_FILE_PATH",
     "MASTER_D_PATH",
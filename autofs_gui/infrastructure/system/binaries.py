@@ -0,0 +1,11 @@
+from __future__ import annotations
+import shutil
+
+# Resolved once at import; falls back to the bare name so PATH lookup still applies
+_SYSTEMCTL_PATH = shutil.which("systemctl")
+# False on hosts without systemd (containers, other init systems)
+HAS_SYSTEMCTL = _SYSTEMCTL_PATH is not None
+SYSTEMCTL = _SYSTEMCTL_PATH or "systemctl"
+LS = shutil.which("ls") or "ls"
+UMOUNT = shutil.which("umount") or "umount"
+MOUNTPOINT = shutil.which("mountpoint") or "mountpoint"
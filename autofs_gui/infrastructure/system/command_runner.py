@@ -1,14 +1,18 @@
 from __future__ import annotations
-import os
+import shlex
 import subprocess
-from typing import Tuple
+from typing import Sequence, Tuple, Union
 
 
 class CommandRunner:
     @staticmethod
-    def run(cmd: str, timeout: int = 15) -> Tuple[int, str, str]:
+    def run(cmd: Union[str, Sequence[str]], timeout: int = 15) -> Tuple[int, str, str]:
+        # No intermediate /bin/sh: strings are split into argv, scripts must call a shell explicitly
+        argv = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
         try:
-            proc = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=timeout)
+            proc = subprocess.run(argv, shell=False, capture_output=True, text=True, timeout=timeout)
             return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
         except subprocess.TimeoutExpired:
-            return 124, "", f"Timeout executing: {cmd}"
+            return 124, "", f"Timeout executing: {shlex.join(argv)}"
+        except FileNotFoundError as exc:
+            return 127, "", str(exc)
@@ -1,5 +1,21 @@
 from __future__ import annotations
 import os
+from typing import Iterable, Tuple, Union
+
+Content = Union[str, bytes]
+
+
+def _write_tmp(tmp: str, content: Content) -> None:
+    # Pre-encoded single write loop + fsync so the new file is on disk before the rename
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 class FileSystemGateway:
@@ -12,17 +28,71 @@ class FileSystemGateway:
             return None
 
     @staticmethod
-    def write_file_atomic(path: str, content: str) -> None:
+    def read_file_bytes(path: str) -> bytes | None:
+        # Raw read sized from fstat; no text decoding for callers that only search bytes
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            chunks = [os.read(fd, os.fstat(fd).st_size or 65536)]
+            while chunks[-1]:
+                chunks.append(os.read(fd, 65536))
+            return b"".join(chunks)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def get_mtime(path: str) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def write_file_atomic(path: str, content: Content) -> None:
         tmp = path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            f.write(content)
+        _write_tmp(tmp, content)
         os.replace(tmp, path)
 
+    @staticmethod
+    def write_files_atomic(pairs: Iterable[Tuple[str, Content]]) -> None:
+        # Stage every file first so a failure leaves none of the targets replaced
+        staged = []
+        try:
+            for path, content in pairs:
+                tmp = path + ".tmp"
+                staged.append((tmp, path))
+                _write_tmp(tmp, content)
+        except Exception:
+            for tmp, _ in staged:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+            raise
+        for tmp, path in staged:
+            os.replace(tmp, path)
+
     # Ports compatibility (FilesPort)
     @staticmethod
     def read(path: str) -> str | None:
         return FileSystemGateway.read_file(path)
 
     @staticmethod
-    def write_atomic(path: str, content: str) -> None:
+    def read_bytes(path: str) -> bytes | None:
+        return FileSystemGateway.read_file_bytes(path)
+
+    @staticmethod
+    def mtime(path: str) -> int | None:
+        return FileSystemGateway.get_mtime(path)
+
+    @staticmethod
+    def write_atomic(path: str, content: Content) -> None:
         return FileSystemGateway.write_file_atomic(path, content)
+
+    @staticmethod
+    def write_many_atomic(pairs: Iterable[Tuple[str, Content]]) -> None:
+        return FileSystemGateway.write_files_atomic(pairs)
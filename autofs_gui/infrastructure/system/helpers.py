@@ -1,8 +1,9 @@
 from __future__ import annotations
 import os
 
+# The effective uid of a running process does not change; read it once at import
+_IS_ROOT = os.geteuid() == 0 if hasattr(os, "geteuid") else False
+
+
 def is_root() -> bool:
-    try:
-        return os.geteuid() == 0
-    except AttributeError:
-        return False
+    return _IS_ROOT
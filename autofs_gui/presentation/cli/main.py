@@ -41,6 +41,16 @@ def cmd_load(args):
     return 0
 
 
+def _json_list(value: str) -> List[Dict[str, Any]]:
+    try:
+        data = json.loads(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"JSON inválido: {exc}") from exc
+    if not isinstance(data, list):
+        raise argparse.ArgumentTypeError("se esperaba una lista de entradas")
+    return data
+
+
 def _resolve_entries(args) -> (List[Dict[str, Any]], int, bool):
     use = make_usecases()
     if args.from_state:
@@ -49,9 +59,12 @@ def _resolve_entries(args) -> (List[Dict[str, Any]], int, bool):
         timeout = int(args.timeout) if args.timeout is not None else int(st.get("master_timeout", 120))
         ghost = bool(st.get("master_ghost", True)) if args.ghost is None else bool(args.ghost)
         return entries, timeout, ghost
-    elif args.entries_json:
-        with open(args.entries_json, "r", encoding="utf-8") as f:
-            entries = json.load(f)
+    elif args.entries is not None or args.entries_json:
+        if args.entries is not None:
+            entries = args.entries
+        else:
+            with open(args.entries_json, "r", encoding="utf-8") as f:
+                entries = json.load(f)
         timeout = int(args.timeout or 120)
         ghost = bool(args.ghost if args.ghost is not None else True)
         return entries, timeout, ghost
@@ -134,7 +147,9 @@ def main(argv=None):
 
     pb = sp.add_parser("build", help="Construir archivos y opcionalmente escribirlos")
     pb.add_argument("--from-state", action="store_true", help="Usar estado guardado del usuario")
-    pb.add_argument("--entries-json", help="Ruta a JSON con 'entries' (lista de entradas)")
+    pb_src = pb.add_mutually_exclusive_group()
+    pb_src.add_argument("--entries-json", help="Ruta a JSON con 'entries' (lista de entradas)")
+    pb_src.add_argument("--entries", type=_json_list, help="Lista de entradas como JSON literal")
     pb.add_argument("--timeout", type=int, help="Timeout del master map")
     pb.add_argument("--ghost", type=lambda x: x.lower() in ("1","true","yes","y"), help="Usar --ghost")
     pb.add_argument("--write", action="store_true", help="Escribir a /etc (si root) o /tmp")
@@ -1,12 +1,14 @@
 from __future__ import annotations
 import sys
+from typing import List, Optional
 from PySide6.QtWidgets import QApplication
 # import pyqtdarktheme
 
 from .main_window import MainWindow
 
-def run():
-    app = QApplication(sys.argv)
+def run(argv: Optional[List[str]] = None):
+    # argv excludes the program name; Qt options such as -platform may be passed through
+    app = QApplication(sys.argv if argv is None else [sys.argv[0], *argv])
     # pyqtdarktheme.setup_theme()
 
     window = MainWindow()
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import functools
+import shlex
 import json
+from contextlib import contextmanager
 import os
-from datetime import datetime
+import time
 import threading
-from typing import List, Optional, Tuple
-from shlex import quote as shlex_quote
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QObject, QProcess, QRegularExpression, QRunnable, QThreadPool, QTimer, Qt, Signal
+from PySide6.QtGui import QRegularExpressionValidator, QTextCursor, QTextDocument
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -19,6 +24,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QMessageBox,
     QPlainTextEdit,
+    QPlainTextDocumentLayout,
     QLabel,
     QSpinBox,
     QCheckBox,
@@ -37,22 +43,165 @@ from autofs_gui.application.factory import make_usecases
 from autofs_gui.domain.models import AppState, SshfsEntry
 from autofs_gui.domain.validation import validate_entry
 from autofs_gui.infrastructure.repositories import load_state, save_state, APP_CONFIG_FILE
-from autofs_gui.infrastructure.system import is_root
+from autofs_gui.infrastructure.system import HAS_SYSTEMCTL, is_root
 from autofs_gui.infrastructure.discovery import discover_hosts, HostCandidate
+from autofs_gui.infrastructure.parsers import MountCheck
+
+# Concurrent batch_verify shells used to probe the configured mount points
+_VERIFY_WORKERS = 4
+# Buffered log entries are flushed to the widget in chunks of this size
+_LOG_FLUSH_CHUNK = 16
+
+_LEVEL_LABELS = {
+    "info": "INFO",
+    "success": "ÉXITO",
+    "warning": "AVISO",
+    "error": "ERROR",
+}
+_LEVEL_ORDER = {"info": 0, "success": 1, "warning": 2, "error": 3}
+# (label, minimum level) offered by the log verbosity selector
+_LOG_FILTERS = (
+    ("Todos los mensajes", 0),
+    ("Éxitos, avisos y errores", 1),
+    ("Solo avisos y errores", 2),
+    ("Solo errores", 3),
+)
+# Blocks (lines) kept in the log widget; older ones are dropped by Qt
+_LOG_MAX_BLOCKS = 5000
+# Log entries kept in memory so a less strict filter can show them again
+_LOG_HISTORY_SIZE = 2000
+
+# Quiet period before a burst of state changes is written to disk
+_STATE_SAVE_DELAY_MS = 300
+
+# Limit for ls/umount started from the entry buttons, and grace period after "Cancelar"
+_PROCESS_TIMEOUT_MS = 30000
+_PROCESS_KILL_GRACE_MS = 2000
+
+# Installed once on the window; widgets switch the rules below through dynamic properties
+_WINDOW_STYLE = """
+QLabel#statusIndicator {
+    border: 1px solid #555;
+    border-radius: 8px;
+    background-color: #cccccc;
+}
+QLabel#statusIndicator[state="running"] { background-color: #5cb85c; }
+QLabel#statusIndicator[state="stopped"] { background-color: #d9534f; }
+QLabel#statusIndicator[state="checking"],
+QLabel#statusIndicator[state="unknown"] { background-color: #f0ad4e; }
+QLabel#dirtyLabel[dirty="true"] { color: #d9534f; }
+"""
+
+
+def _exists_fast(path: str) -> bool:
+    # Single stat() that fails fast on OSError (e.g. a stale network home)
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    return True
+
+
+def _capture(fn: Callable[..., Any], *args: Any) -> Tuple[Any, Optional[Exception]]:
+    # (result, None) or (None, exc), so a worker can hand either outcome to the GUI thread
+    try:
+        return fn(*args), None
+    except Exception as exc:
+        return None, exc
+
+
+class _VerifySignals(QObject):
+    # (checks: Dict[str, MountCheck], error: Optional[Exception],
+    #  retry / journal: Optional[(result, error)] of trigger_mount_batch / collect_autofs_log, None when not run)
+    finished = Signal(object, object, object, object)
+
+
+class VerifyRunnable(QRunnable):
+    """Runs the batch mount verification on a QThreadPool worker thread."""
+
+    def __init__(self, usecases, paths: List[str], signals: _VerifySignals):
+        super().__init__()
+        self.usecases = usecases
+        self.paths = paths
+        self.signals = signals
+
+    def run(self) -> None:
+        # Round-robin the paths over a few shells so one slow mount does not serialize the rest
+        workers = min(_VERIFY_WORKERS, len(self.paths))
+        groups = [self.paths[i::workers] for i in range(workers)]
+        checks: Dict[str, MountCheck] = {}
+        error: Optional[Exception] = None
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.usecases.batch_verify, group) for group in groups]
+            for future in futures:
+                try:
+                    checks.update(future.result())
+                except Exception as exc:
+                    error = exc
+        # Partial results are still reported; missing paths show up as unverified
+        if checks:
+            error = None
+        # Both follow-ups may prompt for sudo, so they run one after the other after the probes
+        failed = [path for path in self.paths if path in checks and checks[path].ls_rc != 0]
+        retry = _capture(self.usecases.trigger_mount_batch, failed) if failed else None
+        # The journal is read once per run, and only when a mount point is not mounted
+        journal = None
+        if any(check.mount_rc != 0 for check in checks.values()):
+            journal = _capture(self.usecases.collect_autofs_log)
+        self.signals.finished.emit(checks, error, retry, journal)
 
 
 class MainWindow(QMainWindow):
+    # (callback, future) of a command finished on _cmd_pool
+    _command_done = Signal(object, object)
+    _sudo_prompt_requested = Signal()
+    # error text from the host discovery warm-up thread
+    _host_warmup_failed = Signal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AutoFS GUI")
+        self.setStyleSheet(_WINDOW_STYLE)
 
         self.usecases = make_usecases(ask_pass=self._prompt_sudo_password)
         self.app_state, initial_message = self._load_initial_state()
         self._dirty = False
         self._last_status_state: Optional[str] = None
+        self._last_status_check_ts = 0.0
         self._apply_timer: Optional[QTimer] = None
         self._pending_apply_reason: Optional[str] = None
         self._is_applying = False
+        # Paths of the verification running in the thread pool
+        self._verify_job: Optional[List[str]] = None
+        self._verify_queued = False
+        self._verify_signals = _VerifySignals(self)
+        self._verify_signals.finished.connect(self._on_verify_finished)
+        # Workers for the service buttons; created once instead of per click, shut down on close
+        self._cmd_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="autofs-cmd")
+        self._command_done.connect(self._on_command_done, Qt.ConnectionType.QueuedConnection)
+        self._host_warmup_failed.connect(self._on_host_warmup_failed, Qt.ConnectionType.QueuedConnection)
+        # Workers ask for the sudo password through the GUI thread and wait for the answer
+        self._sudo_prompt_requested.connect(self._on_sudo_prompt_requested, Qt.ConnectionType.BlockingQueuedConnection)
+        self._sudo_prompt_lock = threading.Lock()
+        self._sudo_prompt_result: Optional[str] = None
+        # (process, argv, callback) of the ls/umount started from the entry buttons
+        self._process_job: Optional[Tuple[QProcess, List[str], Callable[[Any, Optional[Exception]], None]]] = None
+        self._process_cancelled = False
+        self._process_timed_out = False
+        self._entry_dialog: Optional[EntryDialog] = None
+        self._output_is_empty = True
+        self._scroll_pending = False
+        self._pending_log: Optional[List[str]] = None
+        self._last_ts_second = 0
+        self._last_ts_str = ""
+        self._log_min_level = 0
+        # (level order, timestamp, level, text)
+        self._log_history: Deque[Tuple[int, str, str, str]] = deque(maxlen=_LOG_HISTORY_SIZE)
+        self._state_dirty = False
+        self._state_save_timer = QTimer(self)
+        self._state_save_timer.setSingleShot(True)
+        self._state_save_timer.setInterval(_STATE_SAVE_DELAY_MS)
+        self._state_save_timer.timeout.connect(self._flush_state)
 
         self._build_ui()
         self._restore_ui_state()
@@ -61,6 +210,10 @@ class MainWindow(QMainWindow):
         self._mark_dirty(False)
         if initial_message:
             self._append_output(initial_message)
+        # Reading /etc and querying systemctl wait until the window has been painted
+        QTimer.singleShot(0, self, self._deferred_startup)
+
+    def _deferred_startup(self) -> None:
         self._warm_host_cache()
         self._start_status_monitor()
         self._load_from_system(initial=True)
@@ -102,8 +255,8 @@ class MainWindow(QMainWindow):
         status_layout.setSpacing(10)
 
         self.status_indicator = QLabel(status_box)
+        self.status_indicator.setObjectName("statusIndicator")
         self.status_indicator.setFixedSize(16, 16)
-        self.status_indicator.setStyleSheet(self._indicator_style("#cccccc"))
         status_layout.addWidget(self.status_indicator)
 
         self.status_label = QLabel("Verificando estado...", status_box)
@@ -172,6 +325,12 @@ class MainWindow(QMainWindow):
         self.btn_umount.setToolTip("Fuerza el desmontaje del punto de montaje local.")
         entry_action_row.addWidget(self.btn_umount)
 
+        self.btn_cancel_cmd = QPushButton("Cancelar")
+        self.btn_cancel_cmd.setEnabled(False)
+        self.btn_cancel_cmd.clicked.connect(self._cancel_process)
+        self.btn_cancel_cmd.setToolTip("Detiene el listado o desmontaje en curso.")
+        entry_action_row.addWidget(self.btn_cancel_cmd)
+
         entry_action_row.addStretch()
         left_col.addLayout(entry_action_row)
 
@@ -194,23 +353,15 @@ class MainWindow(QMainWindow):
         detail_layout.addWidget(self.entry_detail_table)
         left_col.addWidget(detail_box)
 
+        # The panel contents are built on first show (_build_logs_panel); until then
+        # entries only go to _log_history
         logs_box = QGroupBox("Registros", central)
         logs_box.setVisible(False)
-        logs_layout = QVBoxLayout(logs_box)
-        logs_layout.setContentsMargins(10, 8, 10, 8)
-        logs_layout.setSpacing(4)
-        logs_actions = QHBoxLayout()
-        logs_actions.addStretch()
-        self.btn_copy_logs = QPushButton("Copiar registros")
-        self.btn_copy_logs.setToolTip("Copia el contenido actual de los registros al portapapeles.")
-        self.btn_copy_logs.clicked.connect(self._copy_logs)
-        logs_actions.addWidget(self.btn_copy_logs)
-        logs_layout.addLayout(logs_actions)
-        self.output_text = QPlainTextEdit(logs_box)
-        self.output_text.setReadOnly(True)
-        self.output_text.setMinimumHeight(200)
-        self.output_text.setPlaceholderText("Aquí se mostrarán las operaciones ejecutadas y resultados.")
-        logs_layout.addWidget(self.output_text)
+        self.log_level_combo: Optional[QComboBox] = None
+        self.output_text: Optional[QPlainTextEdit] = None
+        self._output_cursor: Optional[QTextCursor] = None
+        # Document created by _set_output (the widget's original one belongs to Qt)
+        self._owned_output_doc: Optional[QTextDocument] = None
         main_layout.addWidget(logs_box)
 
         self.logs_box = logs_box
@@ -227,7 +378,10 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central)
         self.statusBar().showMessage("Listo.")
         self.dirty_label = QLabel("Sin cambios", self)
+        self.dirty_label.setObjectName("dirtyLabel")
         self.statusBar().addPermanentWidget(self.dirty_label)
+        # Without systemctl the service buttons start disabled instead of after the deferred startup
+        self._set_service_buttons_enabled(True)
 
     # ---------------------------------------------------------------- state helpers
     def _load_initial_state(self) -> Tuple[AppState, str]:
@@ -243,13 +397,13 @@ class MainWindow(QMainWindow):
         def worker():
             try:
                 discover_hosts(force=True)
-                QTimer.singleShot(0, lambda: None)  # trigger UI loop
             except Exception as exc:
-                QTimer.singleShot(0, lambda e=exc: self._append_output(
-                    f"No se pudo precargar el listado de hosts: {e}", level="warning"
-                ))
+                self._host_warmup_failed.emit(str(exc))
         threading.Thread(target=worker, daemon=True).start()
 
+    def _on_host_warmup_failed(self, error: str) -> None:
+        self._append_output(f"No se pudo precargar el listado de hosts: {error}", level="warning")
+
     def _apply_master_options(self) -> None:
         self.timeout_spin.blockSignals(True)
         self.ghost_checkbox.blockSignals(True)
@@ -258,7 +412,38 @@ class MainWindow(QMainWindow):
         self.timeout_spin.blockSignals(False)
         self.ghost_checkbox.blockSignals(False)
 
+    def _build_logs_panel(self) -> None:
+        logs_box = self.logs_box
+        logs_layout = QVBoxLayout(logs_box)
+        logs_layout.setContentsMargins(10, 8, 10, 8)
+        logs_layout.setSpacing(4)
+        logs_actions = QHBoxLayout()
+        logs_actions.addWidget(QLabel("Mostrar:", logs_box))
+        self.log_level_combo = QComboBox(logs_box)
+        for label, min_level in _LOG_FILTERS:
+            self.log_level_combo.addItem(label, min_level)
+        self.log_level_combo.setCurrentIndex(max(self.log_level_combo.findData(self._log_min_level), 0))
+        self.log_level_combo.setToolTip("Filtra los registros mostrados por nivel de importancia.")
+        self.log_level_combo.currentIndexChanged.connect(self._on_log_level_changed)
+        logs_actions.addWidget(self.log_level_combo)
+        logs_actions.addStretch()
+        self.btn_copy_logs = QPushButton("Copiar registros")
+        self.btn_copy_logs.setToolTip("Copia el contenido actual de los registros al portapapeles.")
+        self.btn_copy_logs.clicked.connect(self._copy_logs)
+        logs_actions.addWidget(self.btn_copy_logs)
+        logs_layout.addLayout(logs_actions)
+        self.output_text = QPlainTextEdit(logs_box)
+        self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)
+        self.output_text.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        self.output_text.setMinimumHeight(200)
+        self.output_text.setPlaceholderText("Aquí se mostrarán las operaciones ejecutadas y resultados.")
+        logs_layout.addWidget(self.output_text)
+        self._set_output(self._render_log_history())
+
     def _restore_ui_state(self) -> None:
+        if any(min_level == self.app_state.ui.log_min_level for _, min_level in _LOG_FILTERS):
+            self._log_min_level = self.app_state.ui.log_min_level
         geo = self.app_state.ui.window_geometry
         if geo:
             try:
@@ -271,21 +456,28 @@ class MainWindow(QMainWindow):
 
     def _refresh_entries_table(self) -> None:
         entries = self.app_state.entries
-        self.entries_table.setRowCount(len(entries))
-        for row, entry in enumerate(entries):
-            values = [
-                entry.mount_point,
-                entry.host,
-                entry.remote_path,
-                entry.user or "-",
-            ]
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(value)
-                self.entries_table.setItem(row, col, item)
+        table = self.entries_table
+        rows = [
+            (entry.mount_point, entry.host, entry.remote_path, entry.user or "-")
+            for entry in entries
+        ]
+        # Reuse the existing items and only touch cells whose text changed
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(rows))
+            for row, values in enumerate(rows):
+                for col, value in enumerate(values):
+                    item = table.item(row, col)
+                    if item is None:
+                        table.setItem(row, col, QTableWidgetItem(value))
+                    elif item.text() != value:
+                        item.setText(value)
+        finally:
+            table.setUpdatesEnabled(True)
         if entries:
-            self.entries_table.selectRow(0)
+            table.selectRow(0)
         else:
-            self.entry_detail.clear()
+            self.entry_detail_table.setRowCount(0)
 
     def _current_entry_index(self) -> Optional[int]:
         selected = self.entries_table.selectionModel().selectedRows() if self.entries_table.selectionModel() else []
@@ -316,22 +508,17 @@ class MainWindow(QMainWindow):
         return prepared
 
     # ---------------------------------------------------------------- event handlers
-    def _indicator_style(self, color: str) -> str:
-        return (
-            "border: 1px solid #555;"
-            "border-radius: 8px;"
-            f"background-color: {color};"
-        )
+    def _set_style_state(self, widget: QWidget, name: str, value: str) -> None:
+        # Re-polish only when the property changes; the stylesheet itself is never re-parsed
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def _set_service_state(self, state: str, description: str) -> None:
-        color_map = {
-            "running": "#5cb85c",
-            "stopped": "#d9534f",
-            "checking": "#f0ad4e",
-            "unknown": "#f0ad4e",
-        }
-        color = color_map.get(state, "#cccccc")
-        self.status_indicator.setStyleSheet(self._indicator_style(color))
+        self._set_style_state(self.status_indicator, "state", state)
         self.status_label.setText(description)
 
         previous = getattr(self, "_last_status_state", None)
@@ -349,7 +536,7 @@ class MainWindow(QMainWindow):
 
     def _set_service_buttons_enabled(self, enabled: bool) -> None:
         for btn in (self.btn_service_start, self.btn_service_stop, self.btn_service_restart):
-            btn.setEnabled(enabled)
+            btn.setEnabled(enabled and HAS_SYSTEMCTL)
 
     def _short_text(self, text: str, limit: int = 400) -> str:
         snippet = (text or "").strip()
@@ -358,6 +545,11 @@ class MainWindow(QMainWindow):
         return snippet[: limit - 3] + "..."
 
     def _start_status_monitor(self) -> None:
+        if not HAS_SYSTEMCTL:
+            # Nothing to poll: keep the buttons disabled and explain why once
+            self._set_service_buttons_enabled(False)
+            self._set_service_state("unknown", "systemctl no disponible; el estado de autofs no puede consultarse.")
+            return
         self._set_service_state("checking", "Verificando estado del servicio...")
         self.status_timer = QTimer(self)
         self.status_timer.setInterval(5000)
@@ -366,6 +558,9 @@ class MainWindow(QMainWindow):
         self.status_timer.start()
 
     def _check_service_status(self) -> None:
+        if not HAS_SYSTEMCTL:
+            return
+        self._last_status_check_ts = time.monotonic()
         try:
             rc, out, err = self.usecases.service("status")
         except Exception as exc:
@@ -431,6 +626,16 @@ class MainWindow(QMainWindow):
             self.entry_detail_table.setItem(row, 1, QTableWidgetItem(value))
 
     def _prompt_sudo_password(self) -> Optional[str]:
+        if threading.current_thread() is threading.main_thread():
+            return self._ask_sudo_password()
+        with self._sudo_prompt_lock:
+            self._sudo_prompt_requested.emit()
+            return self._sudo_prompt_result
+
+    def _on_sudo_prompt_requested(self) -> None:
+        self._sudo_prompt_result = self._ask_sudo_password()
+
+    def _ask_sudo_password(self) -> Optional[str]:
         pwd, ok = QInputDialog.getText(
             self,
             "Contraseña sudo",
@@ -439,6 +644,79 @@ class MainWindow(QMainWindow):
         )
         return pwd if ok and pwd else None
 
+    def _run_command_async(self, fn: Callable[[], Any], on_done: Callable[[Any, Optional[Exception]], None]) -> None:
+        future = self._cmd_pool.submit(fn)
+        future.add_done_callback(lambda f: self._command_done.emit(on_done, f))
+
+    def _on_command_done(self, on_done: Callable[[Any, Optional[Exception]], None], future: Future) -> None:
+        try:
+            result = future.result()
+        except Exception as exc:
+            on_done(None, exc)
+            return
+        on_done(result, None)
+
+    def _start_process(self, argv: List[str], on_done: Callable[[Any, Optional[Exception]], None]) -> None:
+        # Runs without blocking the event loop; an automount on a slow host can take a while
+        if self._process_job is not None:
+            self._status("Hay un comando en curso. Espera a que termine o cancélalo.", 5000)
+            return
+        proc = QProcess(self)
+        proc.setProgram(argv[0])
+        proc.setArguments(argv[1:])
+        proc.finished.connect(self._on_process_finished)
+        proc.errorOccurred.connect(self._on_process_error)
+        self._process_job = (proc, argv, on_done)
+        self._process_cancelled = False
+        self._process_timed_out = False
+        self.btn_cancel_cmd.setEnabled(True)
+        QTimer.singleShot(_PROCESS_TIMEOUT_MS, proc, self._on_process_timeout)
+        proc.start()
+
+    def _cancel_process(self) -> None:
+        if self._process_job is None:
+            return
+        proc = self._process_job[0]
+        self._process_cancelled = True
+        proc.terminate()
+        QTimer.singleShot(_PROCESS_KILL_GRACE_MS, proc, proc.kill)
+
+    def _on_process_timeout(self) -> None:
+        if self._process_job is not None:
+            self._process_timed_out = True
+            self._process_job[0].kill()
+
+    def _finish_process(self) -> Optional[Tuple[QProcess, List[str], Callable[[Any, Optional[Exception]], None]]]:
+        job, self._process_job = self._process_job, None
+        self.btn_cancel_cmd.setEnabled(False)
+        if job is not None:
+            job[0].deleteLater()
+        return job
+
+    def _on_process_error(self, error: QProcess.ProcessError) -> None:
+        # Only a failed start never reaches finished(); other errors are reported there
+        if error != QProcess.ProcessError.FailedToStart or self._process_job is None:
+            return
+        proc, argv, on_done = self._finish_process()
+        on_done(None, RuntimeError(proc.errorString() or f"No se pudo iniciar {argv[0]}"))
+
+    def _on_process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        job = self._finish_process()
+        if job is None:
+            return
+        proc, argv, on_done = job
+        out = bytes(proc.readAllStandardOutput()).decode("utf-8", "replace").strip()
+        err = bytes(proc.readAllStandardError()).decode("utf-8", "replace").strip()
+        if self._process_cancelled:
+            self._append_output(f"Comando cancelado: {shlex.join(argv)}", level="warning")
+            self._status("Comando cancelado.", 4000)
+            return
+        if self._process_timed_out:
+            on_done((124, out, f"Timeout executing: {shlex.join(argv)}"), None)
+            return
+        rc = exit_code if exit_status == QProcess.ExitStatus.NormalExit else (exit_code or 1)
+        on_done((rc, out, err), None)
+
     def _selected_entry_or_warn(self, action_title: str) -> Optional[SshfsEntry]:
         idx = self._current_entry_index()
         if idx is None:
@@ -447,28 +725,41 @@ class MainWindow(QMainWindow):
         return self.app_state.entries[idx]
 
     # ---------------------------------------------------------------- actions
+    def _entry_dialog_for(self, entry: Optional[SshfsEntry] = None) -> EntryDialog:
+        # One dialog per window: later opens only refill its widgets
+        dialog = self._entry_dialog
+        if dialog is None:
+            dialog = self._entry_dialog = EntryDialog(self, entry, last_dirs=self.app_state.ui.last_dirs)
+        else:
+            dialog.load(entry)
+        return dialog
+
     def _add_entry(self) -> None:
-        dialog = EntryDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            entry = dialog.get_entry()
-            if entry:
-                self.app_state.entries.append(entry)
-                self._refresh_entries_table()
-                self._mark_dirty(True, "Se agregó una entrada.")
+        dialog = self._entry_dialog_for()
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        entry = dialog.get_entry()
+        if entry:
+            self.app_state.entries.append(entry)
+            self._refresh_entries_table()
+            self._mark_dirty(True, "Se agregó una entrada.")
 
     def _edit_entry(self) -> None:
         idx = self._current_entry_index()
         if idx is None:
             QMessageBox.information(self, "Editar entrada", "Selecciona una entrada primero.")
             return
-        dialog = EntryDialog(self, self.app_state.entries[idx])
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            entry = dialog.get_entry()
-            if entry:
-                self.app_state.entries[idx] = entry
-                self._refresh_entries_table()
-                self.entries_table.selectRow(idx)
-                self._mark_dirty(True, "Se actualizó una entrada.")
+        dialog = self._entry_dialog_for(self.app_state.entries[idx])
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        entry = dialog.get_entry()
+        # Looked up after exec(): timers keep running while the modal dialog is open
+        entries = self.app_state.entries
+        if entry and idx < len(entries):
+            entries[idx] = entry
+            self._refresh_entries_table()
+            self.entries_table.selectRow(idx)
+            self._mark_dirty(True, "Se actualizó una entrada.")
 
     def _delete_entry(self) -> None:
         idx = self._current_entry_index()
@@ -510,19 +801,22 @@ class MainWindow(QMainWindow):
         entry = self._selected_entry_or_warn("Listar montaje")
         if not entry:
             return
-        try:
-            rc, out, err = self.usecases.test_ls(entry.mount_point)
-        except Exception as exc:
-            self._show_error(f"No se pudo ejecutar ls en '{entry.mount_point}': {exc}")
+        mount_point = entry.mount_point
+        self._start_process(self.usecases.ls_argv(mount_point), functools.partial(self._on_list_finished, mount_point))
+
+    def _on_list_finished(self, mount_point: str, result: Optional[Tuple[int, str, str]], error: Optional[Exception]) -> None:
+        if error is not None:
+            self._show_error(f"No se pudo ejecutar ls en '{mount_point}': {error}")
             return
+        rc, out, err = result
         if rc == 0:
             listing = self._short_text(out or "No se encontró contenido.", limit=600)
-            message = f"Contenido de {entry.mount_point}:\n{listing}"
+            message = f"Contenido de {mount_point}:\n{listing}"
             self._append_output(message, level="info")
             QMessageBox.information(self, "Contenido del montaje", message)
         else:
             detail = self._short_text(err or out or "Sin detalles disponibles.")
-            message = f"No se pudo listar el punto de montaje {entry.mount_point} (código {rc})."
+            message = f"No se pudo listar el punto de montaje {mount_point} (código {rc})."
             self._append_output(f"{message} Detalle: {detail}", level="warning")
             QMessageBox.warning(self, "Contenido del montaje", f"{message}\n\nDetalle:\n{detail}")
 
@@ -538,18 +832,21 @@ class MainWindow(QMainWindow):
         )
         if confirm != QMessageBox.StandardButton.Yes:
             return
-        try:
-            rc, out, err = self.usecases.umount(entry.mount_point)
-        except Exception as exc:
-            self._show_error(f"No se pudo desmontar '{entry.mount_point}': {exc}")
+        mount_point = entry.mount_point
+        self._start_process(self.usecases.umount_argv(mount_point), functools.partial(self._on_umount_finished, mount_point))
+
+    def _on_umount_finished(self, mount_point: str, result: Optional[Tuple[int, str, str]], error: Optional[Exception]) -> None:
+        if error is not None:
+            self._show_error(f"No se pudo desmontar '{mount_point}': {error}")
             return
+        rc, out, err = result
         if rc == 0:
-            message = f"El punto de montaje {entry.mount_point} se desmontó correctamente."
+            message = f"El punto de montaje {mount_point} se desmontó correctamente."
             self._append_output(message, level="success")
             QMessageBox.information(self, "Desmontar", message)
         else:
             detail = self._short_text(err or out or "Sin detalles disponibles.")
-            message = f"No se pudo desmontar {entry.mount_point} (código {rc})."
+            message = f"No se pudo desmontar {mount_point} (código {rc})."
             self._append_output(f"{message} Detalle: {detail}", level="warning")
             QMessageBox.warning(self, "Desmontar", f"{message}\n\nDetalle:\n{detail}")
 
@@ -569,22 +866,23 @@ class MainWindow(QMainWindow):
         message = "Configuración cargada desde /etc." if initial else "Configuración actualizada desde /etc."
         self._append_output(message)
         self._status(message, 6000)
-        try:
-            self._save_state(silent=True)
-        except Exception:
-            pass
+        self._mark_state_dirty()
 
-    def _save_state(self, silent: bool = False) -> None:
+    def _mark_state_dirty(self) -> None:
+        # Restart the timer so a burst of changes produces a single write
+        self._state_dirty = True
+        self._state_save_timer.start()
+
+    def _flush_state(self) -> None:
+        self._state_save_timer.stop()
+        if not self._state_dirty:
+            return
+        self._state_dirty = False
         self._remember_ui_state()
         try:
             save_state(self.app_state.to_dict())
         except Exception as exc:
-            if silent:
-                raise
-            self._show_error(f"No se pudo guardar el estado: {exc}")
-            return
-        if not silent:
-            self._append_output(f"Estado guardado en {APP_CONFIG_FILE}")
+            self._append_output(f"No se pudo guardar el estado local en {APP_CONFIG_FILE}: {exc}", level="error")
 
     def _service_action(self, action: str) -> None:
         titles = {
@@ -599,16 +897,26 @@ class MainWindow(QMainWindow):
         }
         title = titles.get(action, "Acción del servicio")
         self._set_service_buttons_enabled(False)
-        try:
-            rc, out, err = self.usecases.service(action)
-        except Exception as exc:
-            self._show_error(f"No se pudo ejecutar la acción '{action}': {exc}")
-            return
-        finally:
-            self._set_service_buttons_enabled(True)
+        self._run_command_async(
+            lambda: self.usecases.service(action),
+            functools.partial(self._on_service_action_finished, action, title, success_texts.get(action, "Acción completada.")),
+        )
 
+    def _on_service_action_finished(
+        self,
+        action: str,
+        title: str,
+        success_text: str,
+        result: Optional[Tuple[int, str, str]],
+        error: Optional[Exception],
+    ) -> None:
+        self._set_service_buttons_enabled(True)
+        if error is not None:
+            self._show_error(f"No se pudo ejecutar la acción '{action}': {error}")
+            return
+        rc, out, err = result
         if rc == 0:
-            message = success_texts.get(action, "Acción completada.")
+            message = success_text
             self._append_output(message, level="success")
             QMessageBox.information(self, title, message)
         else:
@@ -626,21 +934,30 @@ class MainWindow(QMainWindow):
         if dirty:
             title += " *"
             self.dirty_label.setText("Cambios sin guardar")
-            self.dirty_label.setStyleSheet("color: #d9534f;")
         else:
             self.dirty_label.setText("Sin cambios")
-            self.dirty_label.setStyleSheet("")
+        self._set_style_state(self.dirty_label, "dirty", "true" if dirty else "false")
         self.setWindowTitle(title)
         if dirty and reason:
             self._schedule_apply(reason)
 
+    def _schedule_scroll_logs(self) -> None:
+        # Coalesce a burst of appends into a single scroll on the next event loop pass
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        QTimer.singleShot(0, self._scroll_logs_to_end)
+
     def _scroll_logs_to_end(self) -> None:
+        self._scroll_pending = False
         if self.output_text:
             sb = self.output_text.verticalScrollBar()
             if sb:
                 sb.setValue(sb.maximum())
 
     def _toggle_logs(self, checked: bool) -> None:
+        if checked and self.output_text is None:
+            self._build_logs_panel()
         self.logs_box.setVisible(checked)
         self.btn_toggle_logs.setText("Ocultar registros" if checked else "Mostrar registros")
 
@@ -654,7 +971,8 @@ class MainWindow(QMainWindow):
         self._status("Detalle copiado al portapapeles.", 4000)
 
     def _copy_logs(self) -> None:
-        text = self.output_text.toPlainText().strip()
+        text = self.output_text.toPlainText() if self.output_text is not None else self._render_log_history()
+        text = text.strip()
         if not text:
             self._status("No hay registros para copiar.", 4000)
             return
@@ -680,12 +998,7 @@ class MainWindow(QMainWindow):
             return
         self._is_applying = True
         try:
-            self._remember_ui_state()
-            try:
-                self._save_state(silent=True)
-            except Exception as exc:
-                self._show_error(f"No se pudo guardar el estado local: {exc}")
-                return
+            self._mark_state_dirty()
 
             if any(entry.allow_other for entry in self.app_state.entries):
                 try:
@@ -732,102 +1045,213 @@ class MainWindow(QMainWindow):
         if rc == 0:
             self._append_output("Servicio autofs reiniciado correctamente.", level="success")
             self._status("Servicio autofs reiniciado.", 4000)
-            self._check_service_status()
+            # A successful restart already tells us the state; the status timer confirms it
+            self._set_service_state("running", "Servicio en ejecución.")
             return True
         else:
             detail = self._short_text(err or out or "Sin detalles disponibles.")
             self._append_output(f"No se pudo reiniciar autofs (código {rc}). Detalle: {detail}", level="warning")
             self._status("No se pudo reiniciar autofs.", 6000)
-            self._check_service_status()
+            if time.monotonic() - self._last_status_check_ts >= 1.0:
+                self._check_service_status()
             return False
 
     def _verify_mounts(self) -> None:
         if not self.app_state.entries:
             return
-        for entry in self.app_state.entries:
-            path = entry.mount_point
-            path_q = shlex_quote(path)
-            ls_cmd = f"ls -la {path_q}"
-            try:
-                rc, out, err = self.usecases.test_ls(path)
-            except Exception as exc:
-                self._append_output(f"Verificación fallida para {path}. Comando: {ls_cmd}. Detalle: {exc}", level="warning")
-                self._status(f"Montaje no verificado en {path}. Revisa el registro.", 8000)
-                continue
-            if rc == 0:
-                listing = self._short_text(out or "Contenido listado correctamente.", limit=400)
-                self._append_output(f"Montaje verificado: {ls_cmd}\n{listing}", level="success")
-            else:
-                detail = self._short_text(err or out or "Sin detalles disponibles.")
-                self._append_output(
-                    f"El montaje no respondió correctamente. Comando: {ls_cmd}. Código: {rc}. Detalle: {detail}",
-                    level="warning",
-                )
-                self._status(f"Montaje no verificado en {path}. Revisa el registro.", 8000)
-                try:
-                    t_rc, t_out, t_err = self.usecases.trigger_mount(path)
-                    detail_trigger = self._short_text(t_out or t_err or "", limit=400)
-                    level = "info" if t_rc == 0 else "warning"
-                    self._append_output(
-                        f"Intento adicional con sudo (ls) para {path} retornó código {t_rc}. Detalle: {detail_trigger}",
-                        level=level,
-                    )
-                except Exception as exc:
-                    self._append_output(f"Fallo al intentar montar {path} con sudo: {exc}", level="warning")
-            mount_cmd = f"mountpoint {path_q}"
-            try:
-                m_rc, m_out, m_err = self.usecases.check_mount(path)
-            except Exception as exc:
-                self._append_output(f"No se pudo comprobar el montaje. Comando: {mount_cmd}. Detalle: {exc}", level="warning")
-                self._status(f"No se pudo comprobar el montaje en {path}.", 8000)
-                continue
-            if m_rc == 0:
-                detail = self._short_text(m_out or "La ruta es un punto de montaje activo.")
-                self._append_output(f"Montaje activo: {mount_cmd}\n{detail}", level="success")
+        if self._verify_job is not None:
+            # Re-run with the latest entries once the current verification finishes
+            self._verify_queued = True
+            return
+        paths = [entry.mount_point for entry in self.app_state.entries]
+        self._verify_job = paths
+        self._status("Verificando montajes...", 8000)
+        QThreadPool.globalInstance().start(VerifyRunnable(self.usecases, paths, self._verify_signals))
+
+    def _on_verify_finished(
+        self,
+        checks: Dict[str, MountCheck],
+        error: Optional[Exception],
+        retry: Optional[Tuple[Any, Optional[Exception]]],
+        journal: Optional[Tuple[Any, Optional[Exception]]],
+    ) -> None:
+        paths = self._verify_job or []
+        self._verify_job = None
+        try:
+            self._report_verify_results(paths, checks, error, retry, journal)
+        finally:
+            if self._verify_queued:
+                self._verify_queued = False
+                self._verify_mounts()
+
+    def _report_verify_results(
+        self,
+        paths: List[str],
+        checks: Dict[str, MountCheck],
+        error: Optional[Exception],
+        retry: Optional[Tuple[Any, Optional[Exception]]],
+        journal: Optional[Tuple[Any, Optional[Exception]]],
+    ) -> None:
+        if error is not None:
+            self._append_output(f"Verificación fallida para {', '.join(paths)}. Detalle: {error}", level="warning")
+            self._status("Montajes no verificados. Revisa el registro.", 8000)
+            return
+        failed_paths: List[str] = []
+        with self._batched_output():
+            for path in paths:
+                check = checks.get(path)
+                if check is None:
+                    self._append_output(f"Verificación fallida para {path}. Detalle: sin resultado de la verificación.", level="warning")
+                    self._status(f"Montaje no verificado en {path}. Revisa el registro.", 8000)
+                    continue
+                self._report_mount_check(check)
+                if check.ls_rc != 0:
+                    failed_paths.append(path)
+            if retry is not None:
+                self._report_mount_retry(failed_paths, *retry)
+            if journal is not None:
+                self._append_autofs_log(*journal)
+
+    def _append_autofs_log(self, result: Optional[Tuple[int, str, str]], error: Optional[Exception]) -> str:
+        # Returns the journal snippet that was logged, or "" when it could not be read
+        if error is not None:
+            self._append_output(f"No se pudieron obtener logs de autofs: {error}", level="warning")
+            return ""
+        l_rc, l_out, l_err = result
+        if l_rc != 0:
+            self._append_output(
+                f"No se pudo leer el journal de autofs (código {l_rc}). Detalle: {l_err or l_out}",
+                level="warning",
+            )
+            return ""
+        snippet = self._short_text(l_out or "(sin salida)", limit=1200)
+        self._append_output("Fragmento del journal de autofs:\n" + snippet, level="info")
+        return snippet
+
+    def _report_mount_retry(
+        self,
+        paths: List[str],
+        result: Optional[Tuple[int, Dict[str, int], str]],
+        error: Optional[Exception],
+    ) -> None:
+        # A single sudo invocation retried every mount whose ls failed
+        if error is not None:
+            self._append_output(f"Fallo al intentar montar {', '.join(paths)} con sudo: {error}", level="warning")
+            return
+        t_rc, results, t_err = result
+        for path in paths:
+            if path in results:
+                rc = results[path]
+                level = "info" if rc == 0 else "warning"
+                self._append_output(f"Intento adicional con sudo (ls) para {path} retornó código {rc}.", level=level)
             else:
-                detail = self._short_text(m_err or m_out or "Sin detalles disponibles.")
+                detail = self._short_text(t_err or "", limit=400)
                 self._append_output(
-                    f"El punto de montaje no aparece como montado. Comando: {mount_cmd}. Código: {m_rc}. Detalle: {detail}",
+                    f"Intento adicional con sudo (ls) para {path} retornó código {t_rc}. Detalle: {detail}",
                     level="warning",
                 )
-                self._status(f"Montaje no detectado en {path}. Revisa el registro.", 8000)
-                try:
-                    l_rc, l_out, l_err = self.usecases.collect_autofs_log()
-                except Exception as exc:
-                    self._append_output(f"No se pudieron obtener logs de autofs: {exc}", level="warning")
-                else:
-                    if l_rc == 0:
-                        snippet = self._short_text(l_out or "(sin salida)", limit=1200)
-                        self._append_output("Fragmento del journal de autofs:\n" + snippet, level="info")
-                    else:
-                        self._append_output(
-                            f"No se pudo leer el journal de autofs (código {l_rc}). Detalle: {l_err or l_out}",
-                            level="warning",
-                        )
+
+    def _report_mount_check(self, check: MountCheck) -> None:
+        path = check.path
+        if check.ls_rc == 0:
+            listing = self._short_text(check.ls_out or "Contenido listado correctamente.", limit=400)
+            self._append_output(f"Montaje verificado: {shlex.join(['ls', '-la', '--', path])}\n{listing}", level="success")
+        else:
+            detail = self._short_text(check.ls_out or "Sin detalles disponibles.")
+            self._append_output(
+                f"El montaje no respondió correctamente. Comando: {shlex.join(['ls', '-la', '--', path])}. Código: {check.ls_rc}. Detalle: {detail}",
+                level="warning",
+            )
+            self._status(f"Montaje no verificado en {path}. Revisa el registro.", 8000)
+        if check.mount_rc == 0:
+            detail = self._short_text(check.mount_out or "La ruta es un punto de montaje activo.")
+            self._append_output(f"Montaje activo: {shlex.join(['mountpoint', '--', path])}\n{detail}", level="success")
+        else:
+            detail = self._short_text(check.mount_out or "Sin detalles disponibles.")
+            self._append_output(
+                f"El punto de montaje no aparece como montado. Comando: {shlex.join(['mountpoint', '--', path])}. Código: {check.mount_rc}. Detalle: {detail}",
+                level="warning",
+            )
+            self._status(f"Montaje no detectado en {path}. Revisa el registro.", 8000)
 
     def _status(self, message: str, timeout: int = 5000) -> None:
         self.statusBar().showMessage(message, timeout)
 
     def _set_output(self, text: str) -> None:
-        self.output_text.setPlainText(text.strip() if text else "")
+        content = text.strip() if text else ""
+        # Lay out a fresh document and swap it in instead of re-laying out the live one
+        doc = QTextDocument(self.output_text)
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+        doc.setDefaultFont(self.output_text.font())
+        doc.setUndoRedoEnabled(False)
+        doc.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        doc.setPlainText(content)
+        self.output_text.setDocument(doc)
+        if self._owned_output_doc is not None:
+            self._owned_output_doc.deleteLater()
+        self._owned_output_doc = doc
+        self._output_cursor = QTextCursor(doc)
+        self._output_is_empty = not content
         self._scroll_logs_to_end()
 
     def _append_output(self, text: str, level: str = "info") -> None:
         if not text:
             return
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        level_label = {
-            "info": "INFO",
-            "success": "ÉXITO",
-            "warning": "AVISO",
-            "error": "ERROR",
-        }.get(level, "INFO")
-        entry = f"[{timestamp}] {level_label}: {text.strip()}"
-        current = self.output_text.toPlainText()
-        if current:
-            self.output_text.appendPlainText("")
-        self.output_text.appendPlainText(entry)
-        self._scroll_logs_to_end()
+        now = int(time.time())
+        if now != self._last_ts_second:
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_ts_second = now
+        timestamp = self._last_ts_str
+        order = _LEVEL_ORDER.get(level, 0)
+        self._log_history.append((order, timestamp, level, text))
+        if order < self._log_min_level or self.output_text is None:
+            return
+        entry = self._format_log_entry(timestamp, level, text)
+        if self._pending_log is None:
+            self._append_output_bulk(entry)
+            return
+        self._pending_log.append(entry)
+        if len(self._pending_log) >= _LOG_FLUSH_CHUNK:
+            self._append_output_bulk("\n\n".join(self._pending_log))
+            self._pending_log.clear()
+
+    def _format_log_entry(self, timestamp: str, level: str, text: str) -> str:
+        return f"[{timestamp}] {_LEVEL_LABELS.get(level, 'INFO')}: {text.strip()}"
+
+    def _on_log_level_changed(self, index: int) -> None:
+        min_level = self.log_level_combo.itemData(index)
+        self._log_min_level = int(min_level or 0)
+        self.app_state.ui.log_min_level = self._log_min_level
+        self._mark_state_dirty()
+        self._set_output(self._render_log_history())
+
+    def _render_log_history(self) -> str:
+        return "\n\n".join(
+            self._format_log_entry(ts, level, text)
+            for order, ts, level, text in self._log_history
+            if order >= self._log_min_level
+        )
+
+    def _append_output_bulk(self, text: str) -> None:
+        cursor = self._output_cursor
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text if self._output_is_empty else "\n\n" + text)
+        self._output_is_empty = False
+        self._schedule_scroll_logs()
+
+    @contextmanager
+    def _batched_output(self) -> Iterator[None]:
+        # Collect _append_output entries and write them with a single insert on exit
+        if self._pending_log is not None:
+            yield
+            return
+        self._pending_log = []
+        try:
+            yield
+        finally:
+            pending, self._pending_log = self._pending_log, None
+            if pending:
+                self._append_output_bulk("\n\n".join(pending))
 
     def _show_error(self, message: str) -> None:
         self._append_output(message, level="error")
@@ -846,27 +1270,73 @@ class MainWindow(QMainWindow):
             if confirm != QMessageBox.StandardButton.Yes:
                 event.ignore()
                 return
-        self._remember_ui_state()
-        try:
-            save_state(self.app_state.to_dict())
-        except Exception:
-            pass
+        # Window geometry always changes the state, so force the final write
+        self._state_dirty = True
+        self._flush_state()
         if hasattr(self, "status_timer"):
             self.status_timer.stop()
+        self._cmd_pool.shutdown(wait=False, cancel_futures=True)
         super().closeEvent(event)
 
 
+# EntryDialog rows built from tables. Defaults mirror SshfsEntry's and fill empty text fields.
+# (attribute, label, entry field, default)
+_BASIC_TEXT_FIELDS = (
+    ("remote_edit", "Ruta remota", "remote_path", ""),
+    ("user_edit", "Usuario", "user", ""),
+    ("fstype_edit", "FSType", "fstype", "fuse.sshfs"),
+)
+_ADVANCED_TEXT_FIELDS = (
+    ("uid_edit", "UID", "uid", "1000"),
+    ("gid_edit", "GID", "gid", "1000"),
+    ("umask_edit", "Umask", "umask", "022"),
+)
+_EXTRA_TEXT_FIELDS = (
+    ("extra_edit", "Opciones extra", "extra_options", ""),
+)
+# Keystroke filters for the numeric text fields: decimal ids and an octal umask
+_FIELD_PATTERNS = {
+    "uid": QRegularExpression(r"\d{0,10}"),
+    "gid": QRegularExpression(r"\d{0,10}"),
+    "umask": QRegularExpression(r"[0-7]{0,4}"),
+}
+# (attribute, label, entry field, minimum, maximum, default)
+_ADVANCED_SPIN_FIELDS = (
+    ("sai_spin", "ServerAliveInterval", "server_alive_interval", 0, 3600, 15),
+    ("sac_spin", "ServerAliveCountMax", "server_alive_count", 1, 60, 3),
+)
+# (attribute, entry field, default) shown together on the "Reconexión" row
+_RECONNECT_FLAGS = (
+    ("reconnect_chk", "reconnect", True),
+    ("delay_connect_chk", "delay_connect", True),
+)
+
+
 class EntryDialog(QDialog):
-    def __init__(self, parent: Optional[QWidget], entry: Optional[SshfsEntry] = None):
+    # (hosts, error) posted by the discovery worker thread
+    hosts_ready = Signal(list, str)
+
+    # First identity file found on disk; shared by every dialog instance
+    _default_identity_cache: Optional[str] = None
+    # Start directory for the identity chooser (~/.ssh when it exists)
+    _ssh_dir_cache: Optional[str] = None
+
+    def __init__(
+        self,
+        parent: Optional[QWidget],
+        entry: Optional[SshfsEntry] = None,
+        last_dirs: Optional[Dict[str, str]] = None,
+    ):
         super().__init__(parent)
-        self.setWindowTitle("Agregar entrada" if entry is None else "Editar entrada")
         self._result: Optional[SshfsEntry] = None
+        # Shared with UIState.last_dirs so the choice survives restarts
+        self._last_dirs = last_dirs if last_dirs is not None else {}
 
         layout = QVBoxLayout(self)
         form = QFormLayout()
         form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
 
-        self.mount_edit = QLineEdit(entry.mount_point if entry else "")
+        self.mount_edit = QLineEdit()
         self.mount_edit.setPlaceholderText("Ej.: /mnt/proyecto")
         mount_container = QWidget()
         mount_layout = QHBoxLayout(mount_container)
@@ -880,13 +1350,13 @@ class EntryDialog(QDialog):
         form.addRow("Punto de montaje", mount_container)
 
         self.host_candidates: List[HostCandidate] = []
+        # (lower-cased name, label) of the host_combo items, in combo order
+        self._host_items: List[Tuple[str, str]] = []
         self.host_combo = QComboBox()
         self.host_combo.setEditable(True)
         self.host_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.host_combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContents)
         self.host_combo.lineEdit().setPlaceholderText("Ej.: servidor.local")
-        if entry and entry.host:
-            self.host_combo.setEditText(entry.host)
         host_container = QWidget()
         host_layout = QHBoxLayout(host_container)
         host_layout.setContentsMargins(0, 0, 0, 0)
@@ -898,17 +1368,9 @@ class EntryDialog(QDialog):
         host_layout.addWidget(self.btn_hosts_refresh)
         form.addRow("Host", host_container)
 
-        self.remote_edit = QLineEdit(entry.remote_path if entry else "")
-        form.addRow("Ruta remota", self.remote_edit)
-
-        self.user_edit = QLineEdit(entry.user if entry else "")
-        form.addRow("Usuario", self.user_edit)
+        self._add_text_rows(form, _BASIC_TEXT_FIELDS)
 
-        self.fstype_edit = QLineEdit(entry.fstype if entry else "fuse.sshfs")
-        form.addRow("FSType", self.fstype_edit)
-
-        identity_default = entry.identity_file if entry and entry.identity_file else self._default_identity_path()
-        self.identity_edit = QLineEdit(identity_default)
+        self.identity_edit = QLineEdit()
         identity_container = QWidget()
         identity_layout = QHBoxLayout(identity_container)
         identity_layout.setContentsMargins(0, 0, 0, 0)
@@ -921,44 +1383,19 @@ class EntryDialog(QDialog):
         form.addRow("Identity file", identity_container)
 
         self.allow_other_chk = QCheckBox("allow_other")
-        self.allow_other_chk.setChecked(entry.allow_other if entry else True)
         form.addRow("Opciones generales", self.allow_other_chk)
 
-        self.uid_edit = QLineEdit(entry.uid if entry else "1000")
-        form.addRow("UID", self.uid_edit)
-
-        self.gid_edit = QLineEdit(entry.gid if entry else "1000")
-        form.addRow("GID", self.gid_edit)
-
-        self.umask_edit = QLineEdit(entry.umask if entry else "022")
-        form.addRow("Umask", self.umask_edit)
-
-        self.sai_spin = QSpinBox()
-        self.sai_spin.setRange(0, 3600)
-        self.sai_spin.setValue(entry.server_alive_interval if entry else 15)
-        form.addRow("ServerAliveInterval", self.sai_spin)
-
-        self.sac_spin = QSpinBox()
-        self.sac_spin.setRange(1, 60)
-        self.sac_spin.setValue(entry.server_alive_count if entry else 3)
-        form.addRow("ServerAliveCountMax", self.sac_spin)
-
-        self.reconnect_chk = QCheckBox("reconnect")
-        self.reconnect_chk.setChecked(entry.reconnect if entry else True)
-        self.delay_connect_chk = QCheckBox("delay_connect")
-        self.delay_connect_chk.setChecked(entry.delay_connect if entry else True)
-
-        reconnect_box = QHBoxLayout()
-        reconnect_box.addWidget(self.reconnect_chk)
-        reconnect_box.addWidget(self.delay_connect_chk)
-        reconnect_box.addStretch()
-        form.addRow("Reconexión", reconnect_box)
-
-        self.extra_edit = QLineEdit(entry.extra_options if entry else "")
-        form.addRow("Opciones extra", self.extra_edit)
-
         layout.addLayout(form)
 
+        # Permissions/reliability widgets are only created if the user opens the section
+        self._entry: Optional[SshfsEntry] = None
+        self.advanced_box: Optional[QGroupBox] = None
+        self.btn_advanced = QPushButton("Opciones avanzadas")
+        self.btn_advanced.setCheckable(True)
+        self.btn_advanced.setToolTip("Permisos, reconexión y opciones extra de SSHFS.")
+        self.btn_advanced.toggled.connect(self._toggle_advanced)
+        layout.addWidget(self.btn_advanced)
+
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
@@ -966,12 +1403,122 @@ class EntryDialog(QDialog):
 
         self.resize(460, 0)
         self._host_loader: Optional[threading.Thread] = None
+        self.hosts_ready.connect(self._apply_host_candidates, Qt.ConnectionType.QueuedConnection)
+        self.load(entry)
         self._load_hosts_async(initial=True, force=True)
 
+    def load(self, entry: Optional[SshfsEntry] = None) -> None:
+        """Fill the existing widgets with ``entry``, or with the defaults for a new one."""
+        self.setWindowTitle("Agregar entrada" if entry is None else "Editar entrada")
+        self._entry = entry
+        self._result = None
+        self.mount_edit.setText(entry.mount_point if entry else "")
+        host = entry.host if entry else (self.host_combo.itemData(0) if self.host_combo.count() else "")
+        # The index must follow the text: accept() prefers the current item's data
+        self.host_combo.setCurrentIndex(self.host_combo.findData(host) if host else -1)
+        self.host_combo.setEditText(host)
+        self._load_text_rows(_BASIC_TEXT_FIELDS, entry)
+        self.identity_edit.setText(entry.identity_file if entry and entry.identity_file else self._default_identity_path())
+        self.allow_other_chk.setChecked(entry.allow_other if entry else True)
+        if self.advanced_box is not None:
+            self._load_advanced(entry)
+        if self._host_loader is not None:
+            # Reopened dialog: refresh the host list from the discovery cache
+            self._load_hosts_async()
+        self.mount_edit.setFocus()
+
+    def _toggle_advanced(self, checked: bool) -> None:
+        if checked and self.advanced_box is None:
+            self._build_advanced()
+        if self.advanced_box is not None:
+            self.advanced_box.setVisible(checked)
+        self.adjustSize()
+
+    def _build_advanced(self) -> None:
+        box = QGroupBox("Permisos y fiabilidad", self)
+        form = QFormLayout(box)
+        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+
+        self._add_text_rows(form, _ADVANCED_TEXT_FIELDS)
+        for attr, label, key, minimum, maximum, default in _ADVANCED_SPIN_FIELDS:
+            spin = QSpinBox()
+            spin.setRange(minimum, maximum)
+            setattr(self, attr, spin)
+            form.addRow(label, spin)
+
+        reconnect_box = QHBoxLayout()
+        for attr, key, default in _RECONNECT_FLAGS:
+            chk = QCheckBox(key)
+            setattr(self, attr, chk)
+            reconnect_box.addWidget(chk)
+        reconnect_box.addStretch()
+        form.addRow("Reconexión", reconnect_box)
+
+        self._add_text_rows(form, _EXTRA_TEXT_FIELDS)
+
+        layout = self.layout()
+        layout.insertWidget(layout.indexOf(self.btn_advanced) + 1, box)
+        self.advanced_box = box
+        self._load_advanced(self._entry)
+
+    def _load_advanced(self, entry: Optional[SshfsEntry]) -> None:
+        self._load_text_rows(_ADVANCED_TEXT_FIELDS + _EXTRA_TEXT_FIELDS, entry)
+        for attr, _, key, _, _, default in _ADVANCED_SPIN_FIELDS:
+            getattr(self, attr).setValue(getattr(entry, key) if entry else default)
+        for attr, key, default in _RECONNECT_FLAGS:
+            getattr(self, attr).setChecked(getattr(entry, key) if entry else default)
+
+    def _add_text_rows(self, form: QFormLayout, fields) -> None:
+        for attr, label, key, default in fields:
+            edit = QLineEdit()
+            pattern = _FIELD_PATTERNS.get(key)
+            if pattern is not None:
+                edit.setValidator(QRegularExpressionValidator(pattern, edit))
+            setattr(self, attr, edit)
+            form.addRow(label, edit)
+
+    def _load_text_rows(self, fields, entry: Optional[SshfsEntry]) -> None:
+        for attr, _, key, default in fields:
+            getattr(self, attr).setText(getattr(entry, key) if entry else default)
+
+    def _text_values(self, fields) -> Dict[str, Any]:
+        return {key: getattr(self, attr).text().strip() or default for attr, _, key, default in fields}
+
+    def _advanced_values(self) -> Dict[str, Any]:
+        if self.advanced_box is not None:
+            values = self._text_values(_ADVANCED_TEXT_FIELDS + _EXTRA_TEXT_FIELDS)
+            values.update({key: int(getattr(self, attr).value()) for attr, _, key, *_ in _ADVANCED_SPIN_FIELDS})
+            values.update({key: getattr(self, attr).isChecked() for attr, key, _ in _RECONNECT_FLAGS})
+            return values
+        # Section never opened: keep the entry's values (the model defaults match the widgets')
+        entry = self._entry or SshfsEntry(mount_point="", host="", remote_path="")
+        values = {
+            key: getattr(entry, key).strip() or default
+            for _, _, key, default in _ADVANCED_TEXT_FIELDS + _EXTRA_TEXT_FIELDS
+        }
+        values.update({key: int(getattr(entry, key)) for _, _, key, *_ in _ADVANCED_SPIN_FIELDS})
+        values.update({key: getattr(entry, key) for _, key, _ in _RECONNECT_FLAGS})
+        return values
+
+    def _start_dir(self, key: str, fallback: str) -> str:
+        last = self._last_dirs.get(key)
+        return last if last and _exists_fast(last) else fallback
+
+    def _remember_dir(self, key: str, path: str) -> None:
+        # Store the parent: it is local, while the chosen path may itself be an SSHFS mount
+        directory = os.path.dirname(path.rstrip("/")) or "/"
+        if self._last_dirs.get(key) == directory:
+            return
+        self._last_dirs[key] = directory
+        parent = self.parent()
+        if parent and hasattr(parent, "_mark_state_dirty"):
+            parent._mark_state_dirty()
+
     def _select_mount_point(self) -> None:
-        path = QFileDialog.getExistingDirectory(self, "Seleccionar punto de montaje")
+        path = QFileDialog.getExistingDirectory(self, "Seleccionar punto de montaje", self._start_dir("mount", "/mnt"))
         if path:
             self.mount_edit.setText(path)
+            self._remember_dir("mount", path)
 
     def _current_host_text(self) -> str:
         text = self.host_combo.currentText().strip()
@@ -992,103 +1539,120 @@ class EntryDialog(QDialog):
         if initial:
             self.host_combo.lineEdit().setPlaceholderText("Buscando hosts…")
 
-        try:
-            cached_hosts = discover_hosts(force=False)
-        except Exception:
-            cached_hosts = []
-        if cached_hosts:
-            self._apply_host_candidates(cached_hosts, "")
-
         def worker():
+            # Even the cached lookup may hit the filesystem; keep it off the UI thread
+            try:
+                cached = discover_hosts(force=False)
+            except Exception:
+                cached = []
+            if cached:
+                self.hosts_ready.emit(cached, "")
             try:
                 hosts = discover_hosts(force=force)
                 error = ""
             except Exception as exc:
                 hosts = []
                 error = str(exc)
-            QTimer.singleShot(0, lambda: self._apply_host_candidates(hosts, error))
+            self.hosts_ready.emit(hosts, error)
 
         thread = threading.Thread(target=worker, daemon=True)
         self._host_loader = thread
         thread.start()
 
     def _apply_host_candidates(self, hosts: List[HostCandidate], error: str) -> None:
-        self.host_candidates = hosts
-        current = self._current_host_text()
-        self.host_combo.blockSignals(True)
-        self.host_combo.clear()
-        seen = set()
+        wanted: Dict[str, Tuple[str, HostCandidate]] = {}
         for cand in hosts:
-            key = cand.name.lower()
-            if key in seen:
-                continue
-            seen.add(key)
             label = cand.name
             if cand.address:
                 label += f" ({cand.address})"
             label += f" [{cand.source}]"
-            self.host_combo.addItem(label, cand.name)
-
-        if current:
-            self.host_combo.setEditText(current)
-        elif hosts:
-            self.host_combo.setCurrentIndex(0)
-            self.host_combo.setEditText(hosts[0].name)
-        else:
-            self.host_combo.setEditText(current)
-        self.host_combo.blockSignals(False)
+            wanted.setdefault(cand.name.lower(), (label, cand))
+        items = [(key, label) for key, (label, _) in wanted.items()]
         self.host_combo.lineEdit().setPlaceholderText("Ej.: servidor.local")
         self.btn_hosts_refresh.setEnabled(True)
+        if not error and items == self._host_items:
+            return
+
+        self.host_candidates = hosts
+        current = self._current_host_text()
+        self.host_combo.blockSignals(True)
+        # Drop vanished or relabelled items, then insert/move the rest into discovery order
+        keep = set(items)
+        for idx in range(len(self._host_items) - 1, -1, -1):
+            if self._host_items[idx] not in keep:
+                self.host_combo.removeItem(idx)
+                del self._host_items[idx]
+        for pos, (key, label) in enumerate(items):
+            if pos < len(self._host_items) and self._host_items[pos] == (key, label):
+                continue
+            if (key, label) in self._host_items:
+                old = self._host_items.index((key, label))
+                self.host_combo.removeItem(old)
+                del self._host_items[old]
+            self.host_combo.insertItem(pos, label, wanted[key][1].name)
+            self._host_items.insert(pos, (key, label))
+
+        # Select the item that matches the text, so itemData never points at another host
+        selected = current or (hosts[0].name if hosts else "")
+        self.host_combo.setCurrentIndex(self.host_combo.findData(selected) if selected else -1)
+        self.host_combo.setEditText(selected)
+        self.host_combo.blockSignals(False)
 
         parent = self.parent()
         if error:
             if parent and hasattr(parent, "_append_output"):
                 parent._append_output(f"No se pudo descubrir hosts: {error}", level="warning")
         elif hosts and parent and hasattr(parent, "_append_output"):
-            preview = ", ".join(c.name for c in hosts[:8])
-            if len(hosts) > 8:
-                preview += ", …"
-            parent._append_output(f"Hosts detectados ({len(hosts)}): {preview}", level="info")
+            more = ", …" if len(hosts) > 8 else ""
+            parent._append_output(
+                f"Hosts detectados ({len(hosts)}): {', '.join([c.name for c in hosts[:8]])}{more}",
+                level="info",
+            )
 
     def _default_identity_path(self) -> str:
+        cls = type(self)
+        if cls._default_identity_cache is not None:
+            return cls._default_identity_cache
         root_key = "/root/.ssh/id_ed25519"
-        if os.path.exists(root_key):
+        if _exists_fast(root_key):
+            cls._default_identity_cache = root_key
             return root_key
         user_key = os.path.expanduser("~/.ssh/id_ed25519")
-        if os.path.exists(user_key):
+        if _exists_fast(user_key):
+            cls._default_identity_cache = user_key
             return user_key
         return ""
 
+    def _default_ssh_dir(self) -> str:
+        cls = type(self)
+        if cls._ssh_dir_cache is None:
+            ssh_dir = os.path.expanduser("~/.ssh")
+            cls._ssh_dir_cache = ssh_dir if _exists_fast(ssh_dir) else os.path.expanduser("~")
+        return cls._ssh_dir_cache
+
     def _select_identity_file(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Seleccionar archivo de identidad", os.path.expanduser("~"))
+        start_dir = self._start_dir("identity", "") or self._default_ssh_dir()
+        path, _ = QFileDialog.getOpenFileName(self, "Seleccionar archivo de identidad", start_dir)
         if path:
             self.identity_edit.setText(path)
+            self._remember_dir("identity", path)
 
     def accept(self) -> None:
-        data = {
-            "mount_point": self.mount_edit.text().strip(),
-            "host": self._current_host_text(),
-            "remote_path": self.remote_edit.text().strip(),
-            "user": self.user_edit.text().strip(),
-            "fstype": self.fstype_edit.text().strip() or "fuse.sshfs",
-            "identity_file": self.identity_edit.text().strip(),
-            "allow_other": self.allow_other_chk.isChecked(),
-            "uid": self.uid_edit.text().strip() or "1000",
-            "gid": self.gid_edit.text().strip() or "1000",
-            "umask": self.umask_edit.text().strip() or "022",
-            "server_alive_interval": int(self.sai_spin.value()),
-            "server_alive_count": int(self.sac_spin.value()),
-            "reconnect": self.reconnect_chk.isChecked(),
-            "delay_connect": self.delay_connect_chk.isChecked(),
-            "extra_options": self.extra_edit.text().strip(),
-        }
+        entry = SshfsEntry(
+            mount_point=self.mount_edit.text().strip(),
+            host=self._current_host_text(),
+            identity_file=self.identity_edit.text().strip(),
+            allow_other=self.allow_other_chk.isChecked(),
+            **self._text_values(_BASIC_TEXT_FIELDS),
+            **self._advanced_values(),
+        )
         try:
-            validate_entry(data)
+            validate_entry(entry)
         except ValueError as exc:
             QMessageBox.warning(self, "Entrada inválida", str(exc))
             return
 
-        self._result = SshfsEntry(**data)
+        self._result = entry
         super().accept()
 
     def get_entry(self) -> Optional[SshfsEntry]:
@@ -1,19 +1,68 @@
 #!/usr/bin/env python3
 import os
+import shutil
+import subprocess
 import sys
+import tempfile
+
+# Set for the elevated child so it does not try to elevate again
+_ELEVATED_FLAG = "AUTOFS_GUI_ELEVATED"
+# Path the elevated child creates on startup, so its own exit code is never taken for pkexec's
+_STARTED_MARKER = "AUTOFS_GUI_STARTED_MARKER"
+# pkexec starts with a clean environment; these are needed for the GUI to reach the display,
+# and HOME keeps the saved state and ~/.ssh in the user's home as with `sudo -E`
+_PKEXEC_ENV_VARS = ("DISPLAY", "XAUTHORITY", "WAYLAND_DISPLAY", "XDG_RUNTIME_DIR", "HOME")
+# Interpreter and script the elevated child is started with, ahead of the user's arguments
+_SCRIPT = os.path.abspath(__file__)
+_SUDO_ARGV_PREFIX = (sys.executable, _SCRIPT)
+
+
+def _try_pkexec(args):
+    if not shutil.which("pkexec") or not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        return None
+    env_args = [f"{name}={os.environ[name]}" for name in _PKEXEC_ENV_VARS if os.environ.get(name)]
+    with tempfile.TemporaryDirectory(prefix="autofs-gui-") as tmp:
+        marker = os.path.join(tmp, "started")
+        env_args.append(f"{_STARTED_MARKER}={marker}")
+        try:
+            rc = subprocess.run(["pkexec", "env", *env_args, f"{_ELEVATED_FLAG}=1", *args]).returncode
+        except OSError:
+            return None
+        # No marker: pkexec failed itself (dismissed dialog, not authorized), so try sudo
+        return rc if os.path.exists(marker) else None
+
+
+def _mark_started():
+    marker = os.environ.pop(_STARTED_MARKER, None)
+    if marker:
+        try:
+            open(marker, "w").close()
+        except OSError:
+            pass
 
 
 def ensure_root():
     if os.name != "posix":
         return
+    if os.environ.get(_ELEVATED_FLAG) == "1":
+        _mark_started()
+        return
     geteuid = getattr(os, "geteuid", None)
     if geteuid is None or geteuid() == 0:
         return
 
-    script = os.path.abspath(__file__)
-    args = [sys.executable, script] + sys.argv[1:]
+    args = [*_SUDO_ARGV_PREFIX, *sys.argv[1:]]
+    # polkit can keep the authorization cached between launches; sudo is the fallback
+    rc = _try_pkexec(args)
+    if rc is not None:
+        sys.exit(rc)
+    os.environ[_ELEVATED_FLAG] = "1"
+    # exec keeps the terminal for sudo's password prompt; descriptors opened by Python are
+    # non-inheritable and no GUI exists yet, so only buffered output needs flushing first
+    sys.stdout.flush()
+    sys.stderr.flush()
     try:
-        os.execvp("sudo", ["sudo", "-E"] + args)
+        os.execvp("sudo", ["sudo", "-E", *args])
     except OSError as exc:
         print(f"No se pudo elevar privilegios automáticamente: {exc}", file=sys.stderr)
         sys.exit(1)
@@ -21,13 +70,6 @@ def ensure_root():
 
 if __name__ == "__main__":
     ensure_root()
-    if len(sys.argv) == 1 or (len(sys.argv) > 1 and sys.argv[1].lower() == "gui"):
-        if len(sys.argv) > 1:
-            del sys.argv[1]
-        from autofs_gui.presentation.gui import app
-
-        app.run()
-    else:
-        from autofs_gui.presentation.cli import main
+    from autofs_gui.__main__ import run
 
-        raise SystemExit(main())
+    run()
@@ -0,0 +1,86 @@
+import pytest
+
+import autofs_gui.application.use_cases.main as uc_module
+from autofs_gui.application.use_cases import UseCases, Paths
+from autofs_gui.infrastructure.parsers import parse_verify_output
+
+
+BATCH_OUTPUT = "\n".join([
+    "##P /mnt/a",
+    "total 0",
+    "drwxr-xr-x 2 root root 40 .",
+    "##L 0",
+    "##M /mnt/a",
+    "/mnt/a is a mountpoint",
+    "##E 0",
+    "##P /mnt/b c",
+    "ls: cannot access '/mnt/b c': No such file or directory",
+    "##L 2",
+    "##M /mnt/b c",
+    "mountpoint: /mnt/b c: No such file or directory",
+    "##E 1",
+])
+
+
+class FakeRunner:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def run(self, cmd, timeout=15):
+        self.calls.append((cmd, timeout))
+        return self.response
+
+
+def test_parse_verify_output():
+    checks = parse_verify_output(BATCH_OUTPUT)
+    assert [c.path for c in checks] == ["/mnt/a", "/mnt/b c"]
+    assert checks[0].ls_rc == 0 and checks[0].mount_rc == 0
+    assert checks[0].ls_out.startswith("total 0")
+    assert checks[0].mount_out == "/mnt/a is a mountpoint"
+    assert checks[1].ls_rc == 2 and checks[1].mount_rc == 1
+    assert "No such file" in checks[1].ls_out
+
+
+def test_parse_verify_output_truncated():
+    checks = parse_verify_output("##P /mnt/a\ntotal 0")
+    assert len(checks) == 1
+    assert checks[0].ls_rc != 0 and checks[0].mount_rc != 0
+
+
+def test_batch_verify_runs_single_command():
+    runner = FakeRunner((0, BATCH_OUTPUT, ""))
+    uc = UseCases(runner, None, Paths("/m", "/p", "/f"))
+    checks = uc.batch_verify(["/mnt/a", "/mnt/b c"])
+    assert len(runner.calls) == 1
+    assert runner.calls[0][0][:2] == ["sh", "-c"]
+    assert "'/mnt/b c'" in runner.calls[0][0][2]
+    assert f"{uc_module.LS} -la" in runner.calls[0][0][2]
+    assert f"{uc_module.MOUNTPOINT} --" in runner.calls[0][0][2]
+    assert checks["/mnt/a"].mount_rc == 0
+    assert checks["/mnt/b c"].ls_rc == 2
+
+
+def test_trigger_mount_batch_parses_results(monkeypatch):
+    calls = []
+
+    def fake_run_sudo(cmd, timeout=30, ask_pass=None):
+        calls.append(cmd)
+        return 0, "motd noise\n/mnt/a 0\n/mnt/b c 2", ""
+
+    monkeypatch.setattr(uc_module, "run_sudo", fake_run_sudo)
+    uc = UseCases(FakeRunner((0, "", "")), None, Paths("/m", "/p", "/f"))
+    rc, results, err = uc.trigger_mount_batch(["/mnt/a", "/mnt/b c"])
+    assert len(calls) == 1
+    assert rc == 0
+    assert results == {"/mnt/a": 0, "/mnt/b c": 2}
+
+
+def test_service_rejects_unknown_actions():
+    runner = FakeRunner((0, "", ""))
+    uc = UseCases(runner, None, Paths("/m", "/p", "/f"))
+    with pytest.raises(ValueError):
+        uc.service("reload")
+    with pytest.raises(ValueError):
+        uc.service_cmd("reload")
+    assert runner.calls == []
@@ -1,16 +1,27 @@
 import json
-import types
+import re
 import importlib
 
-from autofs_gui.presentation.cli.main import main
-cli_module = importlib.import_module("autofs_gui.presentation.cli.main")
 from autofs_gui.infrastructure.system.constants import MASTER_D_PATH, MAP_FILE_PATH
 
+cli_module = importlib.import_module("autofs_gui.presentation.cli.main")
+main = cli_module.main
+
+# Both target paths, in the order `build` prints them
+_PATHS_RE = re.compile(f"{re.escape(MASTER_D_PATH)}.*{re.escape(MAP_FILE_PATH)}", re.DOTALL)
+
+# Default replies for the actions accepted by `service`, built once at import
+_SERVICE_RESPONSES = {
+    action: (0, f"{action.upper()} OK", "")
+    for action in ("status", "start", "stop", "restart", "enable", "disable")
+}
+
 
 class FakeUseCases:
     def __init__(self):
         self.called = []
-        self.service_responses = {}
+        self.called_service = []
+        self.service_responses = dict(_SERVICE_RESPONSES)
         self.build_files_response = ("MASTER_TXT", "MAP_TXT")
         self.read_current_files_response = ("", "")
         self.load_from_system_response = ([], 120, True)
@@ -20,8 +31,11 @@ class FakeUseCases:
         self.ssh_response = (0, "SSH_OK", "")
 
     def service(self, action: str, timeout: int = 30):
-        self.called.append(("service", action))
-        return self.service_responses.get(action, (0, f"{action.upper()} OK", ""))
+        self.called_service.append(action)
+        try:
+            return self.service_responses[action]
+        except KeyError:
+            return (0, f"{action.upper()} OK", "")
 
     def build_files(self, entries, timeout, ghost):
         self.called.append(("build_files", len(entries), timeout, ghost))
@@ -86,23 +100,22 @@ def test_build_no_write_prints_files(monkeypatch, capsys, tmp_path):
     rc = main(["build", "--entries-json", str(entries_path)])
     out = capsys.readouterr().out
     assert rc == 0
-    assert MASTER_D_PATH in out and MAP_FILE_PATH in out
+    assert _PATHS_RE.search(out)
     assert "MASTER_CONTENT" in out and "MAP_CONTENT" in out
 
 
-def test_build_write_and_restart(monkeypatch, capsys, tmp_path):
+def test_build_write_and_restart(monkeypatch, capsys):
     uc = _patch_usecases(monkeypatch)
     uc.write_config_response = {"temporary": False, "paths": (MASTER_D_PATH, MAP_FILE_PATH), "message": "WROTE"}
     uc.service_responses["restart"] = (0, "RESTARTED", "")
-    entries_path = tmp_path / "entries.json"
-    entries_path.write_text(json.dumps([
-        {"mount_point": "/mnt/x", "host": "h", "remote_path": "/r"}
-    ]), encoding="utf-8")
-    rc = main(["build", "--entries-json", str(entries_path), "--write", "--restart"])
+    entries = json.dumps([{"mount_point": "/mnt/x", "host": "h", "remote_path": "/r"}])
+    rc = main(["build", "--entries", entries, "--write", "--restart"])
     out = capsys.readouterr().out
     assert rc == 0
     assert "WROTE" in out
     assert "RESTARTED" in out
+    assert uc.called_service == ["restart"]
+    assert ("build_files", 1, 120, True) in uc.called
 
 
 def test_ssh_check(monkeypatch, capsys):
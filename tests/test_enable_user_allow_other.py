@@ -0,0 +1,36 @@
+from autofs_gui.application.use_cases import UseCases, Paths
+from autofs_gui.infrastructure.system import FileSystemGateway
+
+
+class CountingFiles(FileSystemGateway):
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+
+    def read_bytes(self, path):
+        self.reads += 1
+        return super().read_bytes(path)
+
+    def write_atomic(self, path, content):
+        self.writes += 1
+        return super().write_atomic(path, content)
+
+
+def test_enable_user_allow_other_writes_once(tmp_path):
+    conf = tmp_path / "fuse.conf"
+    conf.write_bytes(b"# fuse\n#user_allow_other\n")
+    files = CountingFiles()
+    uc = UseCases(None, files, Paths("/m", "/p", str(conf)))
+    uc.enable_user_allow_other(str(conf))
+    uc.enable_user_allow_other(str(conf))
+    assert conf.read_bytes() == b"# fuse\nuser_allow_other\n"
+    assert files.writes == 1
+    assert files.reads == 1
+
+
+def test_enable_user_allow_other_skips_enabled_file(tmp_path):
+    conf = tmp_path / "fuse.conf"
+    conf.write_bytes(b"user_allow_other\n")
+    files = CountingFiles()
+    UseCases(None, files, Paths("/m", "/p", str(conf))).enable_user_allow_other(str(conf))
+    assert files.writes == 0
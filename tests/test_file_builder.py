@@ -0,0 +1,58 @@
+import pytest
+
+from autofs_gui.domain.models import SshfsEntry
+from autofs_gui.domain.services import build_master_file, build_map_file, build_map_line
+
+
+def test_build_map_line_full_entry():
+    entry = {
+        "mount_point": "/mnt/data",
+        "user": "ana",
+        "host": "server",
+        "remote_path": "/srv/my data",
+        "identity_file": "/root/.ssh/id_ed25519",
+        "allow_other": True,
+        "uid": "1000",
+        "gid": "1000",
+        "umask": "022",
+        "server_alive_interval": 20,
+        "server_alive_count": 5,
+        "extra_options": "cache=yes, compression=no",
+    }
+    assert build_map_line(entry) == (
+        "/mnt/data -fstype=fuse.sshfs,IdentityFile=/root/.ssh/id_ed25519,"
+        "UserKnownHostsFile=/root/.ssh/known_hosts,StrictHostKeyChecking=accept-new,"
+        "allow_other,uid=1000,gid=1000,umask=022,ServerAliveInterval=20,ServerAliveCountMax=5,"
+        "reconnect,delay_connect,cache=yes,compression=no :ana@server:/srv/my\\040data"
+    )
+
+
+def test_build_map_line_defaults():
+    entry = {"mount_point": "/mnt/a", "host": "h", "remote_path": "/r", "reconnect": False}
+    assert build_map_line(entry) == (
+        "/mnt/a -fstype=fuse.sshfs,ServerAliveInterval=15,ServerAliveCountMax=3,delay_connect :h:/r"
+    )
+
+
+def test_build_map_line_requires_fields():
+    with pytest.raises(ValueError):
+        build_map_line({"mount_point": "/mnt/a", "host": ""})
+
+
+def test_build_map_file_header_and_lines():
+    body = build_map_file([{"mount_point": "/mnt/a", "host": "h", "remote_path": "/r"}])
+    assert body.startswith("# Managed by Autofs Manager GUI (SSHFS)\n")
+    assert body.endswith(":h:/r\n")
+    assert build_map_file([]).endswith("\n\n")
+
+
+def test_build_master_file():
+    body = build_master_file("/etc/auto.sshfs", timeout=60, ghost=True)
+    assert body.splitlines()[-1] == "/- /etc/auto.sshfs --timeout=60 --ghost"
+    assert build_master_file("/etc/auto.sshfs", 30, False).endswith("/- /etc/auto.sshfs --timeout=30\n")
+
+
+def test_build_map_line_accepts_entry_objects():
+    entry = SshfsEntry(mount_point="/mnt/a", host="h", remote_path="/r", user="u", umask="077")
+    assert build_map_line(entry) == build_map_line(entry.to_dict())
+    assert build_map_file([entry]) == build_map_file([entry.to_dict()])
@@ -0,0 +1,38 @@
+import pytest
+
+from autofs_gui.infrastructure.system import FileSystemGateway
+
+
+def test_write_files_atomic_replaces_all(tmp_path):
+    a, b = tmp_path / "a.autofs", tmp_path / "auto.map"
+    a.write_text("old")
+    FileSystemGateway.write_files_atomic([(str(a), "MASTER"), (str(b), "MAP")])
+    assert a.read_text() == "MASTER"
+    assert b.read_text() == "MAP"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.autofs", "auto.map"]
+
+
+def test_write_files_atomic_leaves_targets_on_failure(tmp_path):
+    a = tmp_path / "a.autofs"
+    a.write_text("old")
+    missing = tmp_path / "missing" / "auto.map"
+    with pytest.raises(OSError):
+        FileSystemGateway.write_files_atomic([(str(a), "MASTER"), (str(missing), "MAP")])
+    assert a.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["a.autofs"]
+
+
+def test_write_file_atomic_accepts_bytes(tmp_path):
+    target = tmp_path / "fuse.conf"
+    FileSystemGateway.write_file_atomic(str(target), b"user_allow_other\n")
+    FileSystemGateway.write_file_atomic(str(tmp_path / "text.conf"), "ñ\n")
+    assert target.read_bytes() == b"user_allow_other\n"
+    assert (tmp_path / "text.conf").read_text(encoding="utf-8") == "ñ\n"
+    assert not (tmp_path / "fuse.conf.tmp").exists()
+
+
+def test_read_file_bytes(tmp_path):
+    target = tmp_path / "fuse.conf"
+    target.write_bytes(b"#user_allow_other\n")
+    assert FileSystemGateway.read_file_bytes(str(target)) == b"#user_allow_other\n"
+    assert FileSystemGateway.read_file_bytes(str(tmp_path / "missing")) is None
@@ -0,0 +1,40 @@
+from autofs_gui.domain.services import build_map_file
+from autofs_gui.infrastructure.parsers import parse_map_text
+
+
+def test_parse_map_text_round_trip():
+    entry = {
+        "mount_point": "/mnt/data",
+        "user": "ana",
+        "host": "server",
+        "remote_path": "/srv/my data",
+        "fstype": "fuse.sshfs",
+        "identity_file": "/root/.ssh/id_ed25519",
+        "allow_other": True,
+        "uid": "1000",
+        "gid": "1000",
+        "umask": "022",
+        "server_alive_interval": 20,
+        "server_alive_count": 5,
+        "reconnect": True,
+        "delay_connect": False,
+        "extra_options": "cache=yes",
+    }
+    (parsed,) = parse_map_text(build_map_file([entry]))
+    assert parsed == {
+        **entry,
+        "extra_options": "UserKnownHostsFile=/root/.ssh/known_hosts,StrictHostKeyChecking=accept-new,cache=yes",
+    }
+
+
+def test_parse_map_text_skips_invalid_lines():
+    text = "\n".join([
+        "# comment",
+        "/mnt/a -fstype=fuse.sshfs :host:/r",
+        "/mnt/b -o ro :host:/r",
+        "/mnt/c -fstype=fuse.sshfs,ServerAliveInterval=x :host:/r",
+        "/mnt/d -fstype=fuse.sshfs nohostpath",
+    ])
+    parsed = parse_map_text(text)
+    assert [e["mount_point"] for e in parsed] == ["/mnt/a"]
+    assert parsed[0]["user"] == "" and parsed[0]["server_alive_interval"] == 15